@@ -20,6 +20,24 @@ from app.models.enums import (
 )
 
 
+def _is_valid_ticket_id(ticket_id: str) -> bool:
+    """Check the ticket ID format TKT-{DEPT}-{YYYYMMDD}-{SEQ} with string ops.
+
+    Equivalent to fullmatch on TKT-[A-Z]{2,3}-\\d{8}-\\d{4} over ASCII; the
+    fixed four-part layout needs no regex engine.
+    """
+    parts = ticket_id.split("-")
+    if len(parts) != 4 or not ticket_id.isascii():
+        return False
+    prefix, dept, date, seq = parts
+    return (
+        prefix == "TKT"
+        and 2 <= len(dept) <= 3 and dept.isalpha() and dept.isupper()
+        and len(date) == 8 and date.isdigit()
+        and len(seq) == 4 and seq.isdigit()
+    )
+
+
 # =============================================================================
 # API Request/Response Models
 # =============================================================================
@@ -94,9 +112,7 @@ class ChatResponse(BaseModel):
     def validate_ticket_id(cls, v: Optional[str]) -> Optional[str]:
         """Validate ticket ID format: TKT-{DEPT}-{YYYYMMDD}-{SEQ}"""
         if v is not None:
-            import re
-            pattern = r"^TKT-[A-Z]{2,3}-\d{8}-\d{4}$"
-            if not re.match(pattern, v):
+            if not _is_valid_ticket_id(v):
                 raise ValueError(
                     f"Invalid ticket ID format. Expected TKT-XX-YYYYMMDD-NNNN, got {v}"
                 )
@@ -268,9 +284,7 @@ class ActionResult(BaseModel):
     def validate_ticket_id(cls, v: Optional[str]) -> Optional[str]:
         """Validate ticket ID format."""
         if v is not None:
-            import re
-            pattern = r"^TKT-[A-Z]{2,3}-\d{8}-\d{4}$"
-            if not re.match(pattern, v):
+            if not _is_valid_ticket_id(v):
                 raise ValueError(
                     f"Invalid ticket ID format. Expected TKT-XX-YYYYMMDD-NNNN, got {v}"
                 )
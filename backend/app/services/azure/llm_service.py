@@ -13,6 +13,9 @@ from app.models.enums import Department, IntentCategory, Sentiment
 from app.models.schemas import QueryResult
 from app.services.interfaces import LLMServiceInterface
 
+# JSON payload inside an optional ```json fenced block
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
 
 class AzureOpenAILLMService(LLMServiceInterface):
     """Production implementation of LLM service using Azure OpenAI."""
@@ -23,13 +26,19 @@ class AzureOpenAILLMService(LLMServiceInterface):
         api_key: str,
         deployment: str,
         api_version: str = "2024-05-01-preview",
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        """Initialize Azure OpenAI client."""
+        """Initialize Azure OpenAI client.
+
+        A shared ``client`` may be passed in to reuse pooled connections; the
+        caller then owns it and ``close()`` leaves it open.
+        """
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.deployment = deployment
         self.api_version = api_version
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.AsyncClient(timeout=30.0)
 
     async def _call_openai(
         self,
@@ -58,7 +67,7 @@ class AzureOpenAILLMService(LLMServiceInterface):
     def _parse_json_response(self, content: str) -> dict:
         """Parse JSON from LLM response, handling markdown code blocks."""
         # Try to extract JSON from markdown code blocks
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", content)
+        json_match = _JSON_FENCE_RE.search(content)
         if json_match:
             content = json_match.group(1).strip()
 
@@ -291,5 +300,6 @@ Provide a helpful response that directly addresses the student's question using
             return False, latency_ms, str(e)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if this service created it."""
+        if self._owns_client:
+            await self._client.aclose()
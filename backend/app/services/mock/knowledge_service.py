@@ -5,24 +5,37 @@ Uses simple text matching against sample KB articles.
 
 import json
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from app.models.enums import Department
 from app.models.schemas import KnowledgeArticle
 from app.services.interfaces import KnowledgeServiceInterface
 
+# A raw KB article record from the mock data, and a ranked (article, score) list
+_Article = dict[str, Any]
+_Ranking = tuple[tuple[_Article, float], ...]
+
 
 class MockKnowledgeService(KnowledgeServiceInterface):
     """Mock implementation of knowledge base search."""
 
+    # Maximum number of memoized (query, department) rankings
+    RANKING_CACHE_SIZE: int = 256
+
     def __init__(self) -> None:
         """Initialize with sample KB articles."""
         self._articles = self._load_articles()
+        self._ranking_cache: OrderedDict[tuple[str, Optional[Department]], _Ranking] = (
+            OrderedDict()
+        )
 
     def _load_articles(self) -> list[dict]:
         """Load articles from mock data file."""
-        mock_data_path = Path(__file__).parent.parent.parent.parent / "mock_data" / "sample_kb_articles.json"
+        mock_data_path = (
+            Path(__file__).parent.parent.parent.parent / "mock_data" / "sample_kb_articles.json"
+        )
         if mock_data_path.exists():
             with open(mock_data_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -64,14 +77,22 @@ class MockKnowledgeService(KnowledgeServiceInterface):
 
         return round(score, 2)
 
-    async def search(
+    def _rank(
         self,
         query: str,
-        department: Optional[Department] = None,
-        limit: int = 3,
-    ) -> list[KnowledgeArticle]:
-        """Search articles using text matching."""
-        results = []
+        department: Optional[Department],
+    ) -> _Ranking:
+        """Return (article, score) pairs above threshold, best first.
+
+        The corpus is static, so rankings are memoized per (query, department).
+        """
+        cache_key = (query, department)
+        cached = self._ranking_cache.get(cache_key)
+        if cached is not None:
+            self._ranking_cache.move_to_end(cache_key)
+            return cached
+
+        results: list[tuple[_Article, float]] = []
 
         for article in self._articles:
             # Filter by department if specified
@@ -88,21 +109,35 @@ class MockKnowledgeService(KnowledgeServiceInterface):
         # Sort by relevance score descending
         results.sort(key=lambda x: x[1], reverse=True)
 
-        # Convert to KnowledgeArticle objects
-        articles = []
-        for article, score in results[:limit]:
-            articles.append(
-                KnowledgeArticle(
-                    article_id=article["article_id"],
-                    title=article["title"],
-                    url=article["url"],
-                    snippet=article.get("snippet"),
-                    relevance_score=score,
-                    department=Department(article["department"]) if article.get("department") else None,
-                )
-            )
+        ranked = tuple(results)
+        self._ranking_cache[cache_key] = ranked
+        if len(self._ranking_cache) > self.RANKING_CACHE_SIZE:
+            self._ranking_cache.popitem(last=False)
+        return ranked
+
+    @staticmethod
+    def _to_knowledge_article(article: _Article, score: float) -> KnowledgeArticle:
+        """Build the API model for a ranked article."""
+        return KnowledgeArticle(
+            article_id=article["article_id"],
+            title=article["title"],
+            url=article["url"],
+            snippet=article.get("snippet"),
+            relevance_score=score,
+            department=Department(article["department"]) if article.get("department") else None,
+        )
 
-        return articles
+    async def search(
+        self,
+        query: str,
+        department: Optional[Department] = None,
+        limit: int = 3,
+    ) -> list[KnowledgeArticle]:
+        """Search articles using text matching."""
+        return [
+            self._to_knowledge_article(article, score)
+            for article, score in self._rank(query, department)[:limit]
+        ]
 
     async def search_with_content(
         self,
@@ -111,37 +146,11 @@ class MockKnowledgeService(KnowledgeServiceInterface):
         limit: int = 3,
     ) -> tuple[list[KnowledgeArticle], list[dict]]:
         """Search articles and return both metadata and full content."""
-        results = []
-
-        for article in self._articles:
-            # Filter by department if specified
-            if department:
-                article_dept = article.get("department")
-                if article_dept and article_dept != department.value:
-                    continue
-
-            # Calculate relevance score
-            score = self._calculate_relevance(query, article)
-            if score > 0.1:  # Minimum threshold
-                results.append((article, score))
-
-        # Sort by relevance score descending
-        results.sort(key=lambda x: x[1], reverse=True)
-
         # Build both article metadata and full content lists
         articles = []
         contents = []
-        for article, score in results[:limit]:
-            articles.append(
-                KnowledgeArticle(
-                    article_id=article["article_id"],
-                    title=article["title"],
-                    url=article["url"],
-                    snippet=article.get("snippet"),
-                    relevance_score=score,
-                    department=Department(article["department"]) if article.get("department") else None,
-                )
-            )
+        for article, score in self._rank(query, department)[:limit]:
+            articles.append(self._to_knowledge_article(article, score))
             contents.append({
                 "article_id": article["article_id"],
                 "title": article["title"],
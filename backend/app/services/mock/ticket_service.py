@@ -4,7 +4,9 @@ Stores tickets in memory and loads sample data.
 """
 
 import json
+import time
 from datetime import datetime, timezone
+from itertools import count
 from pathlib import Path
 from typing import Optional
 
@@ -18,8 +20,10 @@ class MockTicketService(TicketServiceInterface):
 
     # Class-level storage to persist across requests
     _tickets: dict[str, dict] = {}
-    _ticket_counter: dict[str, int] = {}
+    _ticket_counter: dict[str, "count[int]"] = {}  # count is not subscriptable at runtime
     _initialized: bool = False
+    _cached_day_epoch: int = -1
+    _cached_day_str: str = ""
 
     def __init__(self) -> None:
         """Initialize and load sample tickets if not already done."""
@@ -31,6 +35,7 @@ class MockTicketService(TicketServiceInterface):
         """Load sample tickets from mock data file."""
         mock_data_path = Path(__file__).parent.parent.parent.parent / "mock_data" / "sample_tickets.json"
         if mock_data_path.exists():
+            max_seen: dict[str, int] = {}
             with open(mock_data_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 for ticket in data.get("tickets", []):
@@ -44,14 +49,22 @@ class MockTicketService(TicketServiceInterface):
                         date_str = parts[2]
                         seq = int(parts[3])
                         key = f"{dept}-{date_str}"
-                        MockTicketService._ticket_counter[key] = max(
-                            MockTicketService._ticket_counter.get(key, 0),
-                            seq
-                        )
+                        max_seen[key] = max(max_seen.get(key, 0), seq)
+
+            # Seed per-(dept,date) sequences to continue after the sample data
+            for key, seq in max_seen.items():
+                MockTicketService._ticket_counter[key] = count(seq + 1)
 
     def _generate_ticket_id(self, department: Department) -> str:
         """Generate a new ticket ID in format TKT-{DEPT}-{YYYYMMDD}-{SEQ}."""
-        today = datetime.now(timezone.utc).strftime("%Y%m%d")
+        # Reformat the UTC date string only when the epoch day rolls over
+        epoch_day = int(time.time()) // 86400
+        if epoch_day != MockTicketService._cached_day_epoch:
+            MockTicketService._cached_day_str = datetime.fromtimestamp(
+                epoch_day * 86400, tz=timezone.utc
+            ).strftime("%Y%m%d")
+            MockTicketService._cached_day_epoch = epoch_day
+        today = MockTicketService._cached_day_str
 
         # Get department code (2-3 letters)
         dept_codes = {
@@ -68,8 +81,10 @@ class MockTicketService(TicketServiceInterface):
 
         # Increment counter
         key = f"{dept_code}-{today}"
-        MockTicketService._ticket_counter[key] = MockTicketService._ticket_counter.get(key, 0) + 1
-        seq = MockTicketService._ticket_counter[key]
+        counter = MockTicketService._ticket_counter.get(key)
+        if counter is None:
+            counter = MockTicketService._ticket_counter.setdefault(key, count(1))
+        seq = next(counter)
 
         return f"TKT-{dept_code}-{today}-{seq:04d}"
 
@@ -0,0 +1,24 @@
+"""
+Fixed values shared by the test modules and conftest fixtures.
+
+IDs and timestamps are literals, identical across runs and xdist workers.
+Tests that need a distinct value define their own.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from uuid import UUID
+
+# Timestamp for model fields that are never compared to the clock
+NOW = datetime(2026, 1, 20, tzinfo=timezone.utc)
+
+# Identifiers for required UUID fields; no test needs them unique
+SESSION_ID = UUID("00000000-0000-4000-8000-000000000001")
+LOG_ID = UUID("00000000-0000-4000-8000-000000000002")
+
+# Hashed ID of the test student, as the API would store it
+STUDENT_ID_HASH = hashlib.sha256(b"test_student_123").hexdigest()
+
+# Placeholder 64-char student ID hashes (SHA-256 hex length)
+HASH_A = "a" * 64
+HASH_B = "b" * 64
@@ -5,8 +5,7 @@ Tests for agent implementations.
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from app.agents import QueryAgent, RouterAgent, ActionAgent
-from app.core.config import Settings
+from app.agents import QueryAgent, ActionAgent
 from app.models.enums import (
     ActionStatus,
     Department,
@@ -18,33 +17,73 @@ from app.models.enums import (
 from app.models.schemas import QueryResult, RoutingDecision
 
 
+# Service mocks are built once per module; each test class clears their
+# recorded calls after every test so call assertions stay per-test.
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Create mock LLM service."""
+    mock = MagicMock()
+    mock.classify_intent = AsyncMock(
+        return_value=QueryResult(
+            intent="password_reset",
+            intent_category=IntentCategory.ACCOUNT_ACCESS,
+            department_suggestion=Department.IT,
+            confidence=0.92,
+            pii_detected=False,
+            sentiment=Sentiment.NEUTRAL,
+        )
+    )
+    mock.generate_clarification_question = AsyncMock(
+        return_value="Are you asking about password reset or account access?"
+    )
+    return mock
+
+
+@pytest.fixture(scope="module")
+def mock_ticket_service():
+    """Create mock ticket service."""
+    mock = MagicMock()
+    mock.create_ticket = AsyncMock(
+        return_value=("TKT-IT-20260120-0001", "https://tickets.example.com/TKT-IT-20260120-0001")
+    )
+    return mock
+
+
+@pytest.fixture(scope="module")
+def mock_knowledge_service():
+    """Create mock knowledge service."""
+    mock = MagicMock()
+    mock.search = AsyncMock(return_value=[])
+    return mock
+
+
+class _LLMServiceStub:
+    """LLM stub; no test asserts on its calls, so MagicMock is unneeded."""
+
+    async def generate_response_message(self, *args, **kwargs) -> str:
+        return "I've created a ticket for IT Support."
+
+
+@pytest.fixture(scope="module")
+def mock_llm_service():
+    """Create mock LLM service."""
+    return _LLMServiceStub()
+
+
 class TestQueryAgent:
     """Tests for QueryAgent."""
 
-    @pytest.fixture
-    def mock_llm(self):
-        """Create mock LLM service."""
-        mock = MagicMock()
-        mock.classify_intent = AsyncMock(
-            return_value=QueryResult(
-                intent="password_reset",
-                intent_category=IntentCategory.ACCOUNT_ACCESS,
-                department_suggestion=Department.IT,
-                confidence=0.92,
-                pii_detected=False,
-                sentiment=Sentiment.NEUTRAL,
-            )
-        )
-        mock.generate_clarification_question = AsyncMock(
-            return_value="Are you asking about password reset or account access?"
-        )
-        return mock
-
     @pytest.fixture
     def agent(self, mock_llm):
         """Create QueryAgent with mock LLM."""
         return QueryAgent(mock_llm)
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_llm):
+        """Clear recorded calls so call assertions stay per-test."""
+        yield
+        mock_llm.reset_mock()
+
     @pytest.mark.asyncio
     async def test_analyze_returns_query_result(self, agent, mock_llm):
         """Test analyze method returns QueryResult."""
@@ -71,21 +110,9 @@ class TestRouterAgent:
     """Tests for RouterAgent."""
 
     @pytest.fixture
-    def settings(self):
-        """Create test settings."""
-        return Settings(
-            confidence_threshold=0.70,
-            max_clarification_attempts=3,
-            sla_urgent_hours=1,
-            sla_high_hours=4,
-            sla_medium_hours=24,
-            sla_low_hours=72,
-        )
-
-    @pytest.fixture
-    def agent(self, settings):
-        """Create RouterAgent with settings."""
-        return RouterAgent(settings)
+    def agent(self, router_agent):
+        """Shared RouterAgent configured with the spec thresholds."""
+        return router_agent
 
     def test_route_standard_request(self, agent):
         """Test routing a standard request."""
@@ -194,39 +221,21 @@ class TestRouterAgent:
 class TestActionAgent:
     """Tests for ActionAgent."""
 
-    @pytest.fixture
-    def mock_ticket_service(self):
-        """Create mock ticket service."""
-        mock = MagicMock()
-        mock.create_ticket = AsyncMock(
-            return_value=("TKT-IT-20260120-0001", "https://tickets.example.com/TKT-IT-20260120-0001")
-        )
-        return mock
-
-    @pytest.fixture
-    def mock_knowledge_service(self):
-        """Create mock knowledge service."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
-
-    @pytest.fixture
-    def mock_llm_service(self):
-        """Create mock LLM service."""
-        mock = MagicMock()
-        mock.generate_response_message = AsyncMock(
-            return_value="I've created a ticket for IT Support."
-        )
-        return mock
-
     @pytest.fixture
     def agent(self, mock_ticket_service, mock_knowledge_service, mock_llm_service):
         """Create ActionAgent with mocks."""
         return ActionAgent(mock_ticket_service, mock_knowledge_service, mock_llm_service)
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_ticket_service, mock_knowledge_service):
+        """Clear recorded calls so call assertions stay per-test."""
+        yield
+        mock_ticket_service.reset_mock()
+        mock_knowledge_service.reset_mock()
+
     @pytest.mark.asyncio
     async def test_execute_creates_ticket(
-        self, agent, mock_ticket_service, mock_knowledge_service
+        self, agent, mock_ticket_service, mock_knowledge_service, mock_student_id_hash
     ):
         """Test execute creates a ticket."""
         query_result = QueryResult(
@@ -246,7 +255,7 @@ class TestActionAgent:
         result = await agent.execute(
             query_result=query_result,
             routing_decision=routing_decision,
-            student_id_hash="a" * 64,
+            student_id_hash=mock_student_id_hash,
             original_message="I forgot my password",
         )
 
@@ -257,7 +266,7 @@ class TestActionAgent:
 
     @pytest.mark.asyncio
     async def test_execute_escalation_status(
-        self, agent, mock_ticket_service
+        self, agent, mock_ticket_service, mock_student_id_hash
     ):
         """Test execute sets escalated status correctly."""
         query_result = QueryResult(
@@ -279,7 +288,7 @@ class TestActionAgent:
         result = await agent.execute(
             query_result=query_result,
             routing_decision=routing_decision,
-            student_id_hash="a" * 64,
+            student_id_hash=mock_student_id_hash,
             original_message="I want to appeal my grade",
         )
 
@@ -4,49 +4,134 @@ API Integration Tests for the Front Door Support Agent.
 These tests verify end-to-end API behavior including:
 - Chat endpoint functionality
 - Session management
-- Error handling
 - Response format compliance
+
+Request-validation (422) tests live in test_api_validation.py.
 """
 
+import asyncio
+import json
 import os
+import re
+import statistics
 import time
-from datetime import datetime, timezone
-from uuid import uuid4
+from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-# Set test environment before importing app
-os.environ["ENVIRONMENT"] = "test"
-os.environ["MOCK_MODE"] = "true"
+_TICKET_ID_RE = re.compile(r"^TKT-[A-Z]{2,3}-\d{8}-\d{4}$")
+
+# Shared request payloads, built once at import. Treat as read-only.
+_PW_MSG = {"message": "I forgot my password"}
+_KB_MSG = {"message": "How do I reset my password?"}
+_HELLO_MSG = {"message": "Hello"}
+# Well-formed but never issued by the app, whose session IDs come from uuid4()
+_UNKNOWN_SESSION_ID = "00000000-0000-4000-8000-0000000000ff"
+
+# conftest.py sets MOCK_MODE before this module is imported, so the app below
+# is built in mock mode. It is imported once here; tests that change settings
+# must use monkeypatch (which restores them), never importlib.reload(app.main).
+from app.main import app as _app  # noqa: E402
+
+# All tests share the session-scoped async client, so they share its loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create test application."""
-    from app.main import app
-    return app
+    """Test application, imported once at module load."""
+    return _app
 
 
-@pytest.fixture
-def client(app):
-    """Create synchronous test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client(app):
-    """Create asynchronous test client."""
+    """Create an asynchronous test client shared across the session.
+
+    Requests go straight through ASGITransport on the session event loop,
+    with no TestClient thread hop. Each chat request without a session_id
+    gets a fresh session, so tests remain isolated.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _warm_app(async_client):
+    """Issue throwaway requests so latency tests measure steady state.
+
+    The first chat request pays for lazy imports, Pydantic model builds and
+    service construction; that cost should not count against NFR budgets.
+    """
+    await async_client.post("/api/chat", json={"message": "warmup"})
+    await async_client.get("/api/health")
+
+
+_LATENCY_SAMPLES = 20
+
+
+async def _measure(call, n: int = _LATENCY_SAMPLES):
+    """Await ``call()`` n times; return sorted latencies (ns) and last response."""
+    samples = []
+    response = None
+    for _ in range(n):
+        start = time.perf_counter_ns()
+        response = await call()
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+    return samples, response
+
+
+def _p99(samples: list[int]) -> int:
+    """Return the 99th-percentile sample from sorted latencies."""
+    return samples[int(0.99 * len(samples))]
+
+
+@pytest.fixture(scope="session")
+def latency_report():
+    """Collect latency samples; written as JSON when LATENCY_REPORT_PATH is set.
+
+    The output mirrors pytest-benchmark's layout so runs can be trended.
+    """
+    report: dict[str, list[int]] = {}
+    yield report
+
+    path = os.environ.get("LATENCY_REPORT_PATH")
+    if not path or not report:
+        return
+    benchmarks = [
+        {
+            "name": name,
+            "stats": {
+                "unit": "ns",
+                "rounds": len(samples),
+                "min": samples[0],
+                "max": samples[-1],
+                "mean": statistics.fmean(samples),
+                "median": statistics.median(samples),
+                "p99": _p99(samples),
+            },
+        }
+        for name, samples in report.items()
+    ]
+    Path(path).write_text(json.dumps({"benchmarks": benchmarks}, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def _flush_sessions():
+    """Start a test with an empty in-memory session store."""
+    from app.services.mock.session_store import MockSessionStore
+    MockSessionStore.clear_all()
+    yield
+    MockSessionStore.clear_all()
+
+
 # =============================================================================
 # Health Check Tests
 # =============================================================================
@@ -54,14 +139,14 @@ async def async_client(app):
 class TestHealthEndpoint:
     """Tests for GET /api/health endpoint."""
 
-    def test_health_check_returns_200(self, client):
+    async def test_health_check_returns_200(self, async_client):
         """Health check should return 200 OK."""
-        response = client.get("/api/health")
+        response = await async_client.get("/api/health")
         assert response.status_code == 200
 
-    def test_health_check_response_structure(self, client):
+    async def test_health_check_response_structure(self, async_client):
         """Health response should have required fields."""
-        response = client.get("/api/health")
+        response = await async_client.get("/api/health")
         data = response.json()
 
         assert "status" in data
@@ -76,85 +161,53 @@ class TestHealthEndpoint:
 class TestChatEndpoint:
     """Tests for POST /api/chat endpoint."""
 
-    def test_chat_requires_message(self, client):
-        """Chat request must include message."""
-        response = client.post("/api/chat", json={})
-        assert response.status_code == 422  # Validation error
-
-    def test_chat_empty_message_rejected(self, client):
-        """Empty message should be rejected."""
-        response = client.post("/api/chat", json={"message": ""})
-        assert response.status_code == 422
-
-    def test_chat_standard_request_success(self, client):
-        """Standard chat request returns expected response."""
-        response = client.post(
-            "/api/chat",
-            json={"message": "I forgot my password"}
-        )
+    # Independent single-message scenarios, sent concurrently once per class
+    CHAT_SCENARIOS = {
+        "standard": "I forgot my password",
+        "account": "I need help with my account",
+        "knowledge": "How do I reset my password?",
+        "escalation": "I want to appeal my grade",
+        "human": "I need to talk to a real person",
+    }
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    @classmethod
+    async def chat_responses(cls, async_client):
+        """Responses for CHAT_SCENARIOS keyed by scenario name."""
+        responses = await asyncio.gather(*[
+            async_client.post("/api/chat", json={"message": message})
+            for message in cls.CHAT_SCENARIOS.values()
+        ])
+        return dict(zip(cls.CHAT_SCENARIOS, responses))
+
+    @pytest.mark.parametrize("scenario,check", [
+        ("standard", lambda d: {"session_id", "message", "status", "escalated"} <= d.keys()),
+        ("account", lambda d: d.get("session_id") is not None),
+        ("knowledge", lambda d: isinstance(d.get("knowledge_articles"), list)),
+        ("escalation", lambda d: d["escalated"] is True and d["escalation_reason"] is not None),
+        ("human", lambda d: (
+            d["escalated"] is True and d["escalation_reason"] == "user_requested_human"
+        )),
+    ], ids=["standard", "session_id", "knowledge_articles", "escalation", "human_request"])
+    async def test_chat_scenarios(self, chat_responses, scenario, check):
+        """Single-message chat scenarios return the expected response shape."""
+        response = chat_responses[scenario]
         assert response.status_code == 200
 
         data = response.json()
-        assert "session_id" in data
-        assert "message" in data
-        assert "status" in data
-        assert "escalated" in data
-
-    def test_chat_response_includes_session_id(self, client):
-        """Chat response must include session_id for follow-up."""
-        response = client.post(
-            "/api/chat",
-            json={"message": "I need help with my account"}
-        )
-        data = response.json()
-
-        assert "session_id" in data
-        assert data["session_id"] is not None
-
-    def test_chat_response_includes_knowledge_articles(self, client):
-        """Chat response should include knowledge articles."""
-        response = client.post(
-            "/api/chat",
-            json={"message": "How do I reset my password?"}
-        )
-        data = response.json()
-
-        assert "knowledge_articles" in data
-        assert isinstance(data["knowledge_articles"], list)
-
-    def test_chat_escalation_response(self, client):
-        """Escalation requests should set escalated=True."""
-        response = client.post(
-            "/api/chat",
-            json={"message": "I want to appeal my grade"}
-        )
-        data = response.json()
+        assert check(data), f"Unexpected response for {scenario!r}: {data}"
 
-        assert data["escalated"] is True
-        assert data["escalation_reason"] is not None
-
-    def test_chat_human_request_escalation(self, client):
-        """Human request should escalate immediately."""
-        response = client.post(
-            "/api/chat",
-            json={"message": "I need to talk to a real person"}
-        )
-        data = response.json()
-
-        assert data["escalated"] is True
-        assert data["escalation_reason"] == "user_requested_human"
-
-    def test_chat_session_continuity(self, client):
+    async def test_chat_session_continuity(self, async_client):
         """Follow-up messages should use same session."""
         # First message
-        response1 = client.post(
+        response1 = await async_client.post(
             "/api/chat",
-            json={"message": "I forgot my password"}
+            json=_PW_MSG
         )
         session_id = response1.json()["session_id"]
 
         # Second message with session
-        response2 = client.post(
+        response2 = await async_client.post(
             "/api/chat",
             json={
                 "message": "Thanks, that helps",
@@ -166,15 +219,6 @@ class TestChatEndpoint:
         # Should use same session
         assert data2["session_id"] == session_id
 
-    def test_chat_message_length_validation(self, client):
-        """Message exceeding max length should be rejected."""
-        long_message = "a" * 2001  # Max is 2000
-        response = client.post(
-            "/api/chat",
-            json={"message": long_message}
-        )
-        assert response.status_code == 422
-
 
 # =============================================================================
 # Session Management Tests
@@ -183,24 +227,23 @@ class TestChatEndpoint:
 class TestSessionManagement:
     """Tests for session-related functionality."""
 
-    def test_new_session_created_without_session_id(self, client):
+    async def test_new_session_created_without_session_id(self, async_client):
         """New session created when no session_id provided."""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
-            json={"message": "Hello"}
+            json=_HELLO_MSG
         )
         data = response.json()
 
         assert data["session_id"] is not None
 
-    def test_invalid_session_id_creates_new_session(self, client):
+    async def test_invalid_session_id_creates_new_session(self, async_client, _flush_sessions):
         """Invalid session_id should create new session."""
-        fake_session_id = str(uuid4())
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={
                 "message": "Hello",
-                "session_id": fake_session_id
+                "session_id": _UNKNOWN_SESSION_ID
             }
         )
         data = response.json()
@@ -217,26 +260,24 @@ class TestSessionManagement:
 class TestResponseFormat:
     """Tests for response format compliance."""
 
-    def test_ticket_id_format_in_response(self, client):
+    async def test_ticket_id_format_in_response(self, async_client):
         """Ticket ID in response should match expected format."""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"message": "The elevator in Smith Hall is broken"}
         )
         data = response.json()
 
         if data.get("ticket_id"):
-            import re
-            pattern = r"^TKT-[A-Z]{2,3}-\d{8}-\d{4}$"
-            assert re.match(pattern, data["ticket_id"]), (
+            assert _TICKET_ID_RE.match(data["ticket_id"]), (
                 f"Ticket ID '{data['ticket_id']}' doesn't match expected format"
             )
 
-    def test_knowledge_article_structure(self, client):
+    async def test_knowledge_article_structure(self, async_client):
         """Knowledge articles should have required fields."""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
-            json={"message": "How do I reset my password?"}
+            json=_KB_MSG
         )
         data = response.json()
 
@@ -246,9 +287,9 @@ class TestResponseFormat:
             assert "url" in article
             assert "relevance_score" in article
 
-    def test_escalation_includes_reason(self, client):
+    async def test_escalation_includes_reason(self, async_client):
         """Escalated responses must include escalation reason."""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"message": "I need to report a Title IX incident"}
         )
@@ -257,42 +298,17 @@ class TestResponseFormat:
         if data["escalated"]:
             assert data["escalation_reason"] is not None
 
-    def test_response_includes_estimated_time(self, client):
+    async def test_response_includes_estimated_time(self, async_client):
         """Response should include estimated response time."""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
-            json={"message": "I forgot my password"}
+            json=_PW_MSG
         )
         data = response.json()
 
         assert "estimated_response_time" in data
 
 
-# =============================================================================
-# Error Handling Tests
-# =============================================================================
-
-class TestErrorHandling:
-    """Tests for error handling behavior."""
-
-    def test_invalid_json_returns_422(self, client):
-        """Invalid JSON should return 422 error."""
-        response = client.post(
-            "/api/chat",
-            content="not valid json",
-            headers={"Content-Type": "application/json"}
-        )
-        assert response.status_code == 422
-
-    def test_missing_required_field_returns_422(self, client):
-        """Missing required field should return 422."""
-        response = client.post(
-            "/api/chat",
-            json={"session_id": str(uuid4())}  # Missing message
-        )
-        assert response.status_code == 422
-
-
 # =============================================================================
 # Knowledge Search Tests
 # =============================================================================
@@ -300,63 +316,57 @@ class TestErrorHandling:
 class TestKnowledgeSearch:
     """Tests for GET /api/knowledge/search endpoint."""
 
-    def test_knowledge_search_requires_query(self, client):
-        """Knowledge search requires query parameter."""
-        response = client.get("/api/knowledge/search")
-        assert response.status_code == 422
+    # Note: API uses 'q' as query parameter name
+    @pytest.mark.parametrize("url,status,check", [
+        ("/api/knowledge/search", 422, None),
+        ("/api/knowledge/search?q=password", 200,
+         lambda d: "articles" in d and "total_results" in d),
+        ("/api/knowledge/search?q=help&limit=2", 200,
+         lambda d: len(d["articles"]) <= 2),
+    ], ids=["requires_query", "returns_results", "respects_limit"])
+    async def test_knowledge_search(self, async_client, url, status, check):
+        """Knowledge search validates the query and honours the limit."""
+        response = await async_client.get(url)
+        assert response.status_code == status
 
-    def test_knowledge_search_returns_results(self, client):
-        """Knowledge search returns articles for valid query."""
-        # Note: API uses 'q' as query parameter name
-        response = client.get("/api/knowledge/search?q=password")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "articles" in data
-        assert "total_results" in data
-
-    def test_knowledge_search_respects_limit(self, client):
-        """Knowledge search respects limit parameter."""
-        response = client.get("/api/knowledge/search?q=help&limit=2")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert len(data["articles"]) <= 2
+        if check is not None:
+            data = response.json()
+            assert check(data), f"Unexpected response for {url}: {data}"
 
 
 # =============================================================================
 # Performance / NFR Tests
 # =============================================================================
 
+@pytest.mark.usefixtures("_warm_app")
 class TestPerformanceRequirements:
     """Tests for non-functional requirements (NFR)."""
 
     # NFR-001: Response within 30 seconds
-    def test_nfr001_response_time(self, client):
-        """NFR-001: Response should be within 30 seconds."""
-        start_time = time.time()
-
-        response = client.post(
-            "/api/chat",
-            json={"message": "I forgot my password"}
+    @pytest.mark.timeout(30)
+    async def test_nfr001_response_time(self, async_client, latency_report):
+        """NFR-001: p99 response time should be within 30 seconds."""
+        samples, response = await _measure(
+            lambda: async_client.post("/api/chat", json=_PW_MSG)
         )
-
-        elapsed = time.time() - start_time
+        latency_report["nfr001_chat"] = samples
 
         assert response.status_code == 200
-        assert elapsed < 30, f"Response took {elapsed:.2f}s, expected < 30s"
+        p99 = _p99(samples)
+        assert p99 < 30e9, f"p99 response took {p99 / 1e9:.2f}s, expected < 30s"
 
-    def test_health_check_fast_response(self, client):
-        """Health check should respond quickly."""
-        start_time = time.time()
-        response = client.get("/api/health")
-        elapsed = time.time() - start_time
+    @pytest.mark.timeout(1)
+    async def test_health_check_fast_response(self, async_client, latency_report):
+        """Health check p99 should be fast."""
+        samples, response = await _measure(lambda: async_client.get("/api/health"))
+        latency_report["health_check"] = samples
 
         assert response.status_code == 200
-        assert elapsed < 1, f"Health check took {elapsed:.2f}s, expected < 1s"
+        p99 = _p99(samples)
+        assert p99 < 1e9, f"p99 health check took {p99 / 1e9:.2f}s, expected < 1s"
 
-    def test_multiple_sequential_requests(self, client):
-        """System should handle multiple sequential requests."""
+    async def test_multiple_concurrent_requests(self, async_client):
+        """System should handle multiple in-flight requests."""
         messages = [
             "I forgot my password",
             "The elevator is broken",
@@ -365,8 +375,11 @@ class TestPerformanceRequirements:
             "I want to appeal my grade",
         ]
 
-        for message in messages:
-            response = client.post("/api/chat", json={"message": message})
+        responses = await asyncio.gather(*[
+            async_client.post("/api/chat", json={"message": message})
+            for message in messages
+        ])
+        for message, response in zip(messages, responses):
             assert response.status_code == 200, f"Failed for message: {message}"
 
 
@@ -387,9 +400,9 @@ class TestDepartmentRouting:
         # Spec says CAMPUS_SAFETY - this is a known gap in the router mapping
         ("I want to appeal my grade", "ESCALATE_TO_HUMAN"),
     ])
-    def test_routing_by_message(self, client, message: str, expected_dept: str):
+    async def test_routing_by_message(self, async_client, message: str, expected_dept: str):
         """Verify routing to correct department based on message."""
-        response = client.post("/api/chat", json={"message": message})
+        response = await async_client.post("/api/chat", json={"message": message})
         data = response.json()
 
         actual_dept = data.get("department")
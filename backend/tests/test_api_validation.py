@@ -0,0 +1,86 @@
+"""
+API Request Validation Tests for the Front Door Support Agent.
+
+These tests only exercise request validation (422 responses), so they run
+against a bare FastAPI app that mounts the API router directly instead of
+importing app.main (no lifespan, middleware or startup logging).
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tests.constants import SESSION_ID
+
+_LONG_MSG = "a" * 2001  # Max is 2000
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def validation_app() -> FastAPI:
+    """Create a minimal application with only the API router mounted."""
+    from app.api import router
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(validation_app: FastAPI) -> TestClient:
+    """Create a synchronous test client for the minimal application."""
+    return TestClient(validation_app)
+
+
+# =============================================================================
+# Chat Request Validation Tests
+# =============================================================================
+
+class TestChatValidation:
+    """Tests for POST /api/chat request validation."""
+
+    def test_chat_requires_message(self, client):
+        """Chat request must include message."""
+        response = client.post("/api/chat", json={})
+        assert response.status_code == 422  # Validation error
+
+    def test_chat_empty_message_rejected(self, client):
+        """Empty message should be rejected."""
+        response = client.post("/api/chat", json={"message": ""})
+        assert response.status_code == 422
+
+    def test_chat_message_length_validation(self, client):
+        """Message exceeding max length should be rejected."""
+        response = client.post(
+            "/api/chat",
+            json={"message": _LONG_MSG}
+        )
+        assert response.status_code == 422
+
+
+# =============================================================================
+# Error Handling Tests
+# =============================================================================
+
+class TestErrorHandling:
+    """Tests for error handling behavior."""
+
+    def test_invalid_json_returns_422(self, client):
+        """Invalid JSON should return 422 error."""
+        response = client.post(
+            "/api/chat",
+            content="not valid json",
+            headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 422
+
+    def test_missing_required_field_returns_422(self, client):
+        """Missing required field should return 422."""
+        response = client.post(
+            "/api/chat",
+            json={"session_id": str(SESSION_ID)}  # Missing message
+        )
+        assert response.status_code == 422
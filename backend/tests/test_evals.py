@@ -3,11 +3,50 @@ Evaluation tests for the Front Door Support Agent.
 Tests intent classification accuracy, routing correctness, and escalation logic.
 """
 
+import re
+from dataclasses import dataclass
+
 import pytest
 from typing import Optional
 
+from app.models.enums import Department, IntentCategory, Sentiment
+
+# Wording expected in escalation and SLA responses
+_HUMAN_RE = re.compile(r"human|team member|specialist|staff|person", re.IGNORECASE)
+_TIME_RE = re.compile(r"hour|day|business|within|expect", re.IGNORECASE)
+
+
+# Case records. The raw tables below stay as tuples for readability and are
+# converted once at import; tests take a single ``case`` parameter.
+@dataclass(frozen=True, slots=True)
+class IntentCase:
+    message: str
+    category: IntentCategory
+    dept: Department
+    escalate: bool
+
+
+@dataclass(frozen=True, slots=True)
+class PiiCase:
+    message: str
+    detect: bool
+    types: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SentimentCase:
+    message: str
+    sentiment: Sentiment
+
+
+@dataclass(frozen=True, slots=True)
+class EntityCase:
+    message: str
+    entities: tuple[tuple[str, str], ...]  # (key, expected value lowercased)
+
+
 # Test data for intent classification evaluation
-INTENT_CLASSIFICATION_CASES = [
+_RAW_INTENT_CASES = [
     # (input_message, expected_intent_category, expected_department, should_escalate)
     # IT / Account Access
     ("I forgot my password", "ACCOUNT_ACCESS", "IT", False),
@@ -70,8 +109,43 @@ INTENT_CLASSIFICATION_CASES = [
     ("I want to speak to a human agent", "HUMAN_REQUEST", "ESCALATE_TO_HUMAN", True),
 ]
 
+# Expected values as enum members, so checks compare by identity
+INTENT_CLASSIFICATION_CASES = [
+    IntentCase(message, IntentCategory[category], Department[dept], should_escalate)
+    for message, category, dept, should_escalate in _RAW_INTENT_CASES
+]
+
+# Cases the original word-overlap matcher already classified correctly. The
+# full table has known mock gaps; these must keep passing as scoring changes.
+_REGRESSION_INTENT_MESSAGES = frozenset({
+    "I forgot my password",
+    "Can't log into Canvas",
+    "My email isn't working",
+    "My account is locked",
+    "I need an official transcript",
+    "I need enrollment verification for my employer",
+    "When will my grades be posted?",
+    "How do I add a class?",
+    "What's the deadline to withdraw?",
+    "When will my financial aid be disbursed?",
+    "I have questions about my FAFSA",
+    "My tuition bill seems wrong",
+    "The elevator in Smith Hall is broken",
+    "I lost my ID card",
+    "I got a parking ticket, how do I pay it?",
+    "I want to appeal my grade",
+    "I'm requesting an exception to the deadline",
+    "Someone is threatening me",
+    "I need to talk to a real person",
+    "Transfer me to a human please",
+})
+REGRESSION_INTENT_CASES = [
+    case for case in INTENT_CLASSIFICATION_CASES
+    if case.message in _REGRESSION_INTENT_MESSAGES
+]
+
 # Test data for PII detection
-PII_DETECTION_CASES = [
+_RAW_PII_CASES = [
     # (input_message, should_detect_pii, expected_pii_types)
     ("I forgot my password", False, []),
     ("My SSN is 123-45-6789", True, ["ssn"]),
@@ -81,9 +155,13 @@ PII_DETECTION_CASES = [
     ("I was born on January 1, 2000", True, ["dob"]),
     ("My date of birth is 01/01/2000", True, ["dob"]),
 ]
+PII_DETECTION_CASES = [
+    PiiCase(message, should_detect, tuple(expected_types))
+    for message, should_detect, expected_types in _RAW_PII_CASES
+]
 
 # Test data for sentiment detection
-SENTIMENT_DETECTION_CASES = [
+_RAW_SENTIMENT_CASES = [
     # (input_message, expected_sentiment)
     ("I need help with my password", "NEUTRAL"),
     ("This is ridiculous, I've been waiting forever!", "FRUSTRATED"),
@@ -93,9 +171,13 @@ SENTIMENT_DETECTION_CASES = [
     ("Thank you so much for your help!", "SATISFIED"),
     ("That was perfect, exactly what I needed", "SATISFIED"),
 ]
+SENTIMENT_DETECTION_CASES = [
+    SentimentCase(message, Sentiment[sentiment])
+    for message, sentiment in _RAW_SENTIMENT_CASES
+]
 
 # Test data for entity extraction
-ENTITY_EXTRACTION_CASES = [
+_RAW_ENTITY_CASES = [
     # (input_message, expected_entities)
     ("The elevator in Smith Hall is broken", {"building": "Smith Hall"}),
     ("I can't log into Canvas", {"system": "Canvas"}),
@@ -104,6 +186,11 @@ ENTITY_EXTRACTION_CASES = [
     ("I'm having trouble with Blackboard", {"system": "Blackboard"}),
     ("I need to drop MATH 201", {"course_code": "MATH201"}),
 ]
+# Entities compare case-insensitively; lowercase the expectations once
+ENTITY_EXTRACTION_CASES = [
+    EntityCase(message, tuple((key, value.lower()) for key, value in expected.items()))
+    for message, expected in _RAW_ENTITY_CASES
+]
 
 # Test data for routing priority
 PRIORITY_CASES = [
@@ -116,45 +203,113 @@ PRIORITY_CASES = [
 ]
 
 
-class TestIntentClassification:
-    """Tests for intent classification accuracy."""
+def _case_ids(cases: list) -> list[str]:
+    """Short, index-prefixed test IDs built from each case's message."""
+    return [f"{i}-{case.message[:30].replace(' ', '_')}" for i, case in enumerate(cases)]
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "message,expected_category,expected_dept,should_escalate",
-        INTENT_CLASSIFICATION_CASES
-    )
-    async def test_intent_classification(
-        self,
-        llm_service,
-        message: str,
-        expected_category: str,
-        expected_dept: str,
-        should_escalate: bool,
-    ):
-        """Test that intents are correctly classified."""
-        result = await llm_service.classify_intent(message)
-
-        # Check escalation flag
-        assert result.requires_escalation == should_escalate, (
-            f"Message '{message}' should {'require' if should_escalate else 'not require'} escalation. "
+# Precomputed so collection does not repr() every long message
+_INTENT_IDS = _case_ids(INTENT_CLASSIFICATION_CASES)
+_PII_IDS = _case_ids(PII_DETECTION_CASES)
+_SENTIMENT_IDS = _case_ids(SENTIMENT_DETECTION_CASES)
+_ENTITY_IDS = _case_ids(ENTITY_EXTRACTION_CASES)
+
+
+# Per-case checks shared by the batched tests and their parametrized
+# counterparts. Each returns a list of human-readable mismatches.
+def _intent_mismatches(result, case: IntentCase) -> list[str]:
+    mismatches = []
+    # Check escalation flag
+    if result.requires_escalation != case.escalate:
+        expectation = "require" if case.escalate else "not require"
+        mismatches.append(
+            f"Message '{case.message}' should {expectation} escalation. "
             f"Got requires_escalation={result.requires_escalation}"
         )
-
-        # Check department routing
-        assert result.department_suggestion.value == expected_dept, (
-            f"Message '{message}' should route to {expected_dept}. "
+    # Check department routing
+    if result.department_suggestion is not case.dept:
+        mismatches.append(
+            f"Message '{case.message}' should route to {case.dept.value}. "
             f"Got {result.department_suggestion.value}"
         )
+    return mismatches
 
-    @pytest.mark.asyncio
-    async def test_low_confidence_triggers_clarification(self, llm_service):
+
+def _pii_mismatches(result, case: PiiCase) -> list[str]:
+    if result.pii_detected != case.detect:
+        return [
+            f"Message '{case.message}' should {'contain' if case.detect else 'not contain'} PII. "
+            f"Got pii_detected={result.pii_detected}"
+        ]
+    if not case.detect:
+        return []
+    return [
+        f"Expected PII type '{pii_type}' not found in {result.pii_types}"
+        for pii_type in case.types
+        if pii_type not in result.pii_types
+    ]
+
+
+def _sentiment_mismatches(result, case: SentimentCase) -> list[str]:
+    if result.sentiment is not case.sentiment:
+        return [
+            f"Message '{case.message}' should have sentiment {case.sentiment.value}. "
+            f"Got {result.sentiment.value}"
+        ]
+    return []
+
+
+def _entity_mismatches(result, case: EntityCase) -> list[str]:
+    mismatches = []
+    for key, expected_lower in case.entities:
+        if key not in result.entities:
+            mismatches.append(f"Expected entity '{key}' not found in {result.entities}")
+            continue
+        # Case-insensitive comparison for string entities
+        actual_value = result.entities[key]
+        if isinstance(actual_value, str) and actual_value.lower() != expected_lower:
+            mismatches.append(
+                f"Entity '{key}' expected '{expected_lower}', got '{actual_value}'"
+            )
+    return mismatches
+
+
+def _batch_mismatches(llm_service, cases, check) -> list[str]:
+    """Classify every case and collect all mismatches."""
+    mismatches = []
+    for case in cases:
+        mismatches.extend(check(llm_service.classify_intent_sync(case.message), case))
+    return mismatches
+
+
+class TestIntentClassification:
+    """Tests for intent classification accuracy."""
+
+    def test_intent_classification_batch(self, llm_service):
+        """Test that intents are correctly classified, reporting every mismatch."""
+        mismatches = _batch_mismatches(
+            llm_service, INTENT_CLASSIFICATION_CASES, _intent_mismatches
+        )
+        if mismatches:
+            pytest.fail("\n".join(mismatches))
+
+    def test_intent_classification_no_regressions(self, llm_service):
+        """Test that cases the original matcher got right still classify correctly."""
+        assert len(REGRESSION_INTENT_CASES) == len(_REGRESSION_INTENT_MESSAGES)
+        mismatches = _batch_mismatches(
+            llm_service, REGRESSION_INTENT_CASES, _intent_mismatches
+        )
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("case", INTENT_CLASSIFICATION_CASES, ids=_INTENT_IDS)
+    def test_intent_classification(self, llm_service, case: IntentCase):
+        """Test that intents are correctly classified (one node per case)."""
+        result = llm_service.classify_intent_sync(case.message)
+        mismatches = _intent_mismatches(result, case)
+        assert not mismatches, "\n".join(mismatches)
+
+    def test_low_confidence_triggers_clarification(self, llm_service):
         """Test that ambiguous messages result in low confidence."""
         ambiguous_messages = [
             "I need help with my account",
@@ -162,119 +317,105 @@ class TestIntentClassification:
             "Can you help me?",
         ]
 
-        for message in ambiguous_messages:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in ambiguous_messages]
+        for message, result in zip(ambiguous_messages, results):
             # Ambiguous messages should have lower confidence
             # The mock service may not perfectly simulate this, but we verify the interface works
             assert hasattr(result, 'confidence')
             assert 0.0 <= result.confidence <= 1.0
 
+    @pytest.mark.asyncio
+    async def test_repeated_message_reuses_classification(self, llm_service):
+        """Test that a repeated message gets an equal but independent result.
+
+        The memoized classification is shared by every caller, so mutating a
+        returned result must not leak into later calls.
+        """
+        first = await llm_service.classify_intent("Can't log into Canvas")
+        first.entities["system"] = "Altered"
+        second = llm_service.classify_intent_sync("Can't log into Canvas")
+        assert second is not first
+        assert second.entities["system"] == "Canvas"
+        assert await llm_service.classify_intent("Can't log into Canvas") == second
+
 
 class TestPIIDetection:
     """Tests for PII detection."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
+    def test_pii_detection_batch(self, llm_service):
+        """Test that PII is correctly detected, reporting every mismatch."""
+        mismatches = _batch_mismatches(llm_service, PII_DETECTION_CASES, _pii_mismatches)
+        if mismatches:
+            pytest.fail("\n".join(mismatches))
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "message,should_detect,expected_types",
-        PII_DETECTION_CASES
-    )
-    async def test_pii_detection(
-        self,
-        llm_service,
-        message: str,
-        should_detect: bool,
-        expected_types: list[str],
-    ):
-        """Test that PII is correctly detected."""
-        result = await llm_service.classify_intent(message)
-
-        assert result.pii_detected == should_detect, (
-            f"Message '{message}' should {'contain' if should_detect else 'not contain'} PII. "
-            f"Got pii_detected={result.pii_detected}"
-        )
-
-        if should_detect:
-            for pii_type in expected_types:
-                assert pii_type in result.pii_types, (
-                    f"Expected PII type '{pii_type}' not found in {result.pii_types}"
-                )
+    @pytest.mark.slow
+    @pytest.mark.parametrize("case", PII_DETECTION_CASES, ids=_PII_IDS)
+    def test_pii_detection(self, llm_service, case: PiiCase):
+        """Test that PII is correctly detected (one node per case)."""
+        result = llm_service.classify_intent_sync(case.message)
+        mismatches = _pii_mismatches(result, case)
+        assert not mismatches, "\n".join(mismatches)
 
 
 class TestSentimentDetection:
     """Tests for sentiment detection."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_sentiment", SENTIMENT_DETECTION_CASES)
-    async def test_sentiment_detection(
-        self,
-        llm_service,
-        message: str,
-        expected_sentiment: str,
-    ):
-        """Test that sentiment is correctly detected."""
-        result = await llm_service.classify_intent(message)
-
-        assert result.sentiment.value == expected_sentiment, (
-            f"Message '{message}' should have sentiment {expected_sentiment}. "
-            f"Got {result.sentiment.value}"
+    def test_sentiment_detection_batch(self, llm_service):
+        """Test that sentiment is correctly detected, reporting every mismatch."""
+        mismatches = _batch_mismatches(
+            llm_service, SENTIMENT_DETECTION_CASES, _sentiment_mismatches
         )
+        if mismatches:
+            pytest.fail("\n".join(mismatches))
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("case", SENTIMENT_DETECTION_CASES, ids=_SENTIMENT_IDS)
+    def test_sentiment_detection(self, llm_service, case: SentimentCase):
+        """Test that sentiment is correctly detected (one node per case)."""
+        result = llm_service.classify_intent_sync(case.message)
+        mismatches = _sentiment_mismatches(result, case)
+        assert not mismatches, "\n".join(mismatches)
 
 
 class TestEntityExtraction:
     """Tests for entity extraction."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_entities", ENTITY_EXTRACTION_CASES)
-    async def test_entity_extraction(
-        self,
-        llm_service,
-        message: str,
-        expected_entities: dict,
-    ):
-        """Test that entities are correctly extracted."""
-        result = await llm_service.classify_intent(message)
-
-        for key, value in expected_entities.items():
-            assert key in result.entities, (
-                f"Expected entity '{key}' not found in {result.entities}"
-            )
-            # Case-insensitive comparison for some entities
-            actual_value = result.entities[key]
-            if isinstance(actual_value, str) and isinstance(value, str):
-                assert actual_value.lower() == value.lower(), (
-                    f"Entity '{key}' expected '{value}', got '{actual_value}'"
-                )
+    def test_entity_extraction_batch(self, llm_service):
+        """Test that entities are correctly extracted, reporting every mismatch."""
+        mismatches = _batch_mismatches(
+            llm_service, ENTITY_EXTRACTION_CASES, _entity_mismatches
+        )
+        if mismatches:
+            pytest.fail("\n".join(mismatches))
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("case", ENTITY_EXTRACTION_CASES, ids=_ENTITY_IDS)
+    def test_entity_extraction(self, llm_service, case: EntityCase):
+        """Test that entities are correctly extracted (one node per case)."""
+        result = llm_service.classify_intent_sync(case.message)
+        mismatches = _entity_mismatches(result, case)
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.parametrize("message,expected", [
+        ("The heat is out in the dorms", {"building": "Dorm"}),
+        ("Is the dormitory wifi down?", {"building": "Dorm"}),
+        # Several candidates: the vocabulary order wins, not message position
+        ("From the library I can't reach Smith Hall", {"building": "Smith Hall"}),
+        ("Outlook works but Canvas won't load", {"system": "Canvas"}),
+        ("Canvas is down in the Student Union for CS101", {
+            "building": "Student Union", "system": "Canvas", "course_code": "CS101",
+        }),
+    ])
+    def test_entity_vocabulary_matching(self, llm_service, message: str, expected: dict):
+        """Test plural/derived building names and multi-entity messages."""
+        entities = llm_service.classify_intent_sync(message).entities
+        assert {key: entities.get(key) for key in expected} == expected
 
 
 class TestEscalationLogic:
     """Tests for escalation triggers."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.mark.asyncio
-    async def test_policy_keywords_trigger_escalation(self, llm_service):
+    def test_policy_keywords_trigger_escalation(self, llm_service):
         """Test that policy keywords trigger escalation."""
         policy_messages = [
             "I want to appeal my grade",
@@ -284,14 +425,13 @@ class TestEscalationLogic:
             "I want to override the prerequisite",
         ]
 
-        for message in policy_messages:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in policy_messages]
+        for message, result in zip(policy_messages, results):
             assert result.requires_escalation, (
                 f"Policy message '{message}' should require escalation"
             )
 
-    @pytest.mark.asyncio
-    async def test_sensitive_topics_trigger_escalation(self, llm_service):
+    def test_sensitive_topics_trigger_escalation(self, llm_service):
         """Test that sensitive topics trigger escalation."""
         sensitive_messages = [
             "I need to report a Title IX violation",
@@ -299,14 +439,13 @@ class TestEscalationLogic:
             "Someone made a threat against me",
         ]
 
-        for message in sensitive_messages:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in sensitive_messages]
+        for message, result in zip(sensitive_messages, results):
             assert result.requires_escalation, (
                 f"Sensitive message '{message}' should require escalation"
             )
 
-    @pytest.mark.asyncio
-    async def test_human_request_triggers_escalation(self, llm_service):
+    def test_human_request_triggers_escalation(self, llm_service):
         """Test that explicit human requests trigger escalation."""
         human_requests = [
             "I need to talk to a person",
@@ -316,8 +455,8 @@ class TestEscalationLogic:
             "Connect me to a real person",
         ]
 
-        for message in human_requests:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in human_requests]
+        for message, result in zip(human_requests, results):
             assert result.requires_escalation, (
                 f"Human request '{message}' should require escalation"
             )
@@ -326,23 +465,23 @@ class TestEscalationLogic:
 class TestKnowledgeBaseValidation:
     """Tests for knowledge base article validation."""
 
-    @pytest.fixture
-    def kb_service(self):
-        """Get knowledge base service for testing."""
-        from app.services.mock.knowledge_service import MockKnowledgeService
-        return MockKnowledgeService()
-
     @pytest.mark.asyncio
     async def test_kb_articles_have_valid_structure(self, kb_service):
         """Test that all KB articles have required fields."""
         # Search for common terms to get articles
         articles = await kb_service.search("password help transcript")
+        assert articles, "Expected KB articles for common terms"
 
-        for article in articles:
-            assert article.article_id, "Article must have article_id"
-            assert article.title, "Article must have title"
-            assert article.url is not None, "Article must have url"
-            assert 0.0 <= article.relevance_score <= 1.0, "Relevance score must be 0-1"
+        incomplete = [
+            article.article_id for article in articles
+            if not (article.article_id and article.title and article.url is not None)
+        ]
+        assert not incomplete, f"Articles missing article_id, title or url: {incomplete}"
+
+        scores = [article.relevance_score for article in articles]
+        assert 0.0 <= min(scores) and max(scores) <= 1.0, (
+            f"Relevance scores must be 0-1, got {scores}"
+        )
 
     @pytest.mark.asyncio
     async def test_kb_search_returns_relevant_results(self, kb_service):
@@ -360,8 +499,6 @@ class TestKnowledgeBaseValidation:
     @pytest.mark.asyncio
     async def test_kb_department_filter(self, kb_service):
         """Test that department filter works correctly."""
-        from app.models.enums import Department
-
         # Search with IT filter
         articles = await kb_service.search("help", department=Department.IT)
 
@@ -375,14 +512,7 @@ class TestKnowledgeBaseValidation:
 class TestAgentBoundaries:
     """Tests for agent authority boundaries (security)."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.mark.asyncio
-    async def test_no_automatic_approval(self, llm_service):
+    def test_no_automatic_approval(self, llm_service):
         """Test that the system never auto-approves policy decisions."""
         approval_requests = [
             "Approve my refund request",
@@ -391,15 +521,14 @@ class TestAgentBoundaries:
             "Override the hold on my account",
         ]
 
-        for message in approval_requests:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in approval_requests]
+        for message, result in zip(approval_requests, results):
             # All policy-related requests should escalate, never auto-approve
             assert result.requires_escalation or result.department_suggestion.value == "ESCALATE_TO_HUMAN", (
                 f"Policy request '{message}' should require human review"
             )
 
-    @pytest.mark.asyncio
-    async def test_no_record_modification(self, llm_service):
+    def test_no_record_modification(self, llm_service):
         """Test that the system doesn't claim to modify records."""
         modification_requests = [
             "Change my grade to an A",
@@ -407,8 +536,8 @@ class TestAgentBoundaries:
             "Modify my financial aid amount",
         ]
 
-        for message in modification_requests:
-            result = await llm_service.classify_intent(message)
+        results = [llm_service.classify_intent_sync(message) for message in modification_requests]
+        for message, result in zip(modification_requests, results):
             # These should all escalate - system cannot modify records
             assert result.requires_escalation or result.department_suggestion.value == "ESCALATE_TO_HUMAN", (
                 f"Record modification request '{message}' should require human review"
@@ -418,17 +547,9 @@ class TestAgentBoundaries:
 class TestResponseQuality:
     """Tests for response message quality."""
 
-    @pytest.fixture
-    def llm_service(self):
-        """Get LLM service for testing."""
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
     @pytest.mark.asyncio
     async def test_response_includes_ticket_id(self, llm_service):
         """Test that responses include ticket ID when created."""
-        from app.models.enums import Department
-
         response = await llm_service.generate_response_message(
             intent="password_reset",
             department=Department.IT,
@@ -444,8 +565,6 @@ class TestResponseQuality:
     @pytest.mark.asyncio
     async def test_escalation_response_mentions_human(self, llm_service):
         """Test that escalation responses mention human review."""
-        from app.models.enums import Department
-
         response = await llm_service.generate_response_message(
             intent="grade_appeal",
             department=Department.ESCALATE_TO_HUMAN,
@@ -455,16 +574,13 @@ class TestResponseQuality:
         )
 
         # Response should indicate human involvement
-        human_indicators = ["human", "team member", "specialist", "staff", "person"]
-        assert any(indicator in response.lower() for indicator in human_indicators), (
+        assert _HUMAN_RE.search(response), (
             "Escalation response should mention human review"
         )
 
     @pytest.mark.asyncio
     async def test_response_includes_sla(self, llm_service):
         """Test that responses include response time expectation."""
-        from app.models.enums import Department
-
         response = await llm_service.generate_response_message(
             intent="facilities_issue",
             department=Department.FACILITIES,
@@ -474,7 +590,6 @@ class TestResponseQuality:
         )
 
         # Response should mention timeframe
-        time_indicators = ["hour", "day", "business", "within", "expect"]
-        assert any(indicator in response.lower() for indicator in time_indicators), (
+        assert _TIME_RE.search(response), (
             "Response should include response time expectation"
         )
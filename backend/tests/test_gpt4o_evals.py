@@ -12,23 +12,42 @@ These tests evaluate the Azure OpenAI GPT-4o model's performance on:
 Tests are skipped if Azure OpenAI credentials are not configured.
 
 NOTE: These tests require real Azure OpenAI credentials from the .env file.
-The conftest.py fixture is configured to NOT override these credentials
-for this specific test file.
+The module is marked ``real_openai`` so conftest.py restores these
+credentials instead of the test placeholders.
 """
 
+import asyncio
+import copy
+import hashlib
+import itertools
+import operator
 import os
+import re
+import sqlite3
 import pytest
+import pytest_asyncio
+from time import perf_counter_ns
 from typing import Optional
 
-# Load environment variables from .env file BEFORE the skipif check
-from dotenv import load_dotenv
-load_dotenv()
+import httpx
+import orjson
 
 # Skip all tests if Azure OpenAI is not configured
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("AZURE_OPENAI_ENDPOINT") or not os.environ.get("AZURE_OPENAI_API_KEY"),
-    reason="Azure OpenAI credentials not configured"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get("AZURE_OPENAI_ENDPOINT") or not os.environ.get("AZURE_OPENAI_API_KEY"),
+        reason="Azure OpenAI credentials not configured"
+    ),
+    pytest.mark.real_openai,
+    # Keep real Azure OpenAI calls on one xdist worker to respect rate limits.
+    # classified_cases already overlaps the calls on that worker's loop;
+    # splitting classes across workers would repeat the prefetch per worker.
+    pytest.mark.xdist_group("azure"),
+    # Run on the session loop that owns the pooled azure_http_client. Tests
+    # must not add their own asyncio mark: the closest mark wins, so a bare
+    # @pytest.mark.asyncio would put that test back on a function loop.
+    pytest.mark.asyncio(loop_scope="session"),
+]
 
 
 # =============================================================================
@@ -39,7 +58,7 @@ pytestmark = pytest.mark.skipif(
 # (message, expected_intent_category, expected_department, should_escalate)
 # Note: expected_intent_category can be a list to allow multiple acceptable categories
 # since GPT-4o may reasonably classify queries differently (e.g., "status check" vs "academic records")
-INTENT_CLASSIFICATION_CASES = [
+_RAW_INTENT_CASES = [
     # IT / Account Access
     ("I forgot my password", "ACCOUNT_ACCESS", "IT", False),
     ("Can't log into Canvas", "ACCOUNT_ACCESS", "IT", False),
@@ -104,19 +123,31 @@ INTENT_CLASSIFICATION_CASES = [
     ("Transfer me to a human please", "HUMAN_REQUEST", "ESCALATE_TO_HUMAN", True),
 ]
 
+
+def _accepted(expected) -> frozenset[str]:
+    """Normalize a single expected value or a list of alternatives to a set."""
+    return frozenset(expected) if isinstance(expected, list) else frozenset((expected,))
+
+
+# Every expectation as a set of accepted values, so checks are one membership test
+INTENT_CLASSIFICATION_CASES = tuple(
+    (message, _accepted(category), _accepted(dept), should_escalate)
+    for message, category, dept, should_escalate in _RAW_INTENT_CASES
+)
+
 # PII detection test cases
-PII_DETECTION_CASES = [
-    ("I forgot my password", False, []),
-    ("My SSN is 123-45-6789", True, ["ssn"]),
-    ("Call me at 555-123-4567", True, ["phone"]),
-    ("My email is student@university.edu", True, ["email"]),
-    ("My credit card is 4111-1111-1111-1111", True, ["credit_card"]),
-    ("I was born on January 1, 2000", True, ["dob"]),
-    ("My social security number is 987-65-4321", True, ["ssn"]),
-]
+PII_DETECTION_CASES = (
+    ("I forgot my password", False, ()),
+    ("My SSN is 123-45-6789", True, ("ssn",)),
+    ("Call me at 555-123-4567", True, ("phone",)),
+    ("My email is student@university.edu", True, ("email",)),
+    ("My credit card is 4111-1111-1111-1111", True, ("credit_card",)),
+    ("I was born on January 1, 2000", True, ("dob",)),
+    ("My social security number is 987-65-4321", True, ("ssn",)),
+)
 
 # Sentiment detection test cases
-SENTIMENT_DETECTION_CASES = [
+SENTIMENT_DETECTION_CASES = (
     ("I need help with my password", "NEUTRAL"),
     ("This is ridiculous, I've been waiting forever!", "FRUSTRATED"),
     ("I'm so frustrated with this system", "FRUSTRATED"),
@@ -124,41 +155,125 @@ SENTIMENT_DETECTION_CASES = [
     ("I have a deadline tonight and can't access my work", "URGENT"),
     ("Thank you so much for your help!", "SATISFIED"),
     ("That was perfect, exactly what I needed", "SATISFIED"),
-]
+)
 
 # Entity extraction test cases
-ENTITY_EXTRACTION_CASES = [
+ENTITY_EXTRACTION_CASES = (
     ("The elevator in Smith Hall is broken", {"building": "Smith Hall"}),
     ("I can't log into Canvas", {"system": "Canvas"}),
     ("The WiFi in the Engineering Building isn't working", {"building": "Engineering Building"}),
     ("I need help with my CS 101 class", {"course_code": "CS 101"}),
     ("I have a deadline on December 15th", {"date": "December 15th"}),
     ("I need my transcript by next Friday", {"date": "next Friday"}),
-]
+)
 
 # Urgency indicator test cases
-URGENCY_INDICATOR_CASES = [
-    ("I need help ASAP", ["asap"]),
-    ("This is urgent, please help", ["urgent"]),
-    ("I have a deadline today", ["deadline", "today"]),
-    ("I need this resolved tonight", ["tonight"]),
-    ("It's an emergency", ["emergency"]),
-    ("I need help with my password", []),
-]
+URGENCY_INDICATOR_CASES = (
+    ("I need help ASAP", ("asap",)),
+    ("This is urgent, please help", ("urgent",)),
+    ("I have a deadline today", ("deadline", "today")),
+    ("I need this resolved tonight", ("tonight",)),
+    ("It's an emergency", ("emergency",)),
+    ("I need help with my password", ()),
+)
+
+
+def _case_ids(cases) -> list[str]:
+    """Short, index-prefixed test IDs built from each case's message."""
+    return [f"{i}-{case[0][:30].replace(' ', '_')}" for i, case in enumerate(cases)]
+
+
+# Precomputed so collection does not repr() every message and expectation
+_INTENT_IDS = _case_ids(INTENT_CLASSIFICATION_CASES)
+_PII_IDS = _case_ids(PII_DETECTION_CASES)
+_SENTIMENT_IDS = _case_ids(SENTIMENT_DETECTION_CASES)
+_ENTITY_IDS = _case_ids(ENTITY_EXTRACTION_CASES)
+_URGENCY_IDS = _case_ids(URGENCY_INDICATOR_CASES)
+
+# Escalation-only inputs. Messages already in INTENT_CLASSIFICATION_CASES are
+# filtered out: test_intent_classification asserts their escalation flag and
+# a department at least as strict, so repeating them adds no coverage.
+_INTENT_MESSAGES = frozenset(case[0] for case in INTENT_CLASSIFICATION_CASES)
+
+_POLICY_ESCALATION_CASES = tuple(case for case in (
+    ("I want to appeal my grade", ("ESCALATE_TO_HUMAN",)),
+    ("Can I get a refund?", ("ESCALATE_TO_HUMAN",)),
+    ("I need a tuition waiver", ("ESCALATE_TO_HUMAN",)),
+    ("I'm requesting an exception", ("ESCALATE_TO_HUMAN",)),
+    ("Can you override this requirement?", ("ESCALATE_TO_HUMAN",)),
+    # Late withdrawal may route to REGISTRAR or ESCALATE_TO_HUMAN depending on LLM interpretation
+    ("I want to withdraw after the deadline", ("ESCALATE_TO_HUMAN", "REGISTRAR")),
+) if case[0] not in _INTENT_MESSAGES)
+
+_SENSITIVE_ESCALATION_MESSAGES = tuple(message for message in (
+    "I need to report a Title IX incident",
+    "I'm being sexually harassed",
+    "I'm feeling suicidal",
+    "I'm having a mental health crisis",
+    "Someone threatened to hurt me",
+    "There's been a violent incident",
+) if message not in _INTENT_MESSAGES)
+
+_HUMAN_REQUEST_MESSAGES = tuple(message for message in (
+    "I want to talk to a real person",
+    "Can I speak with someone?",
+    "Transfer me to a human",
+    "I need to speak with an agent",
+    "Let me talk to a person",
+    "Human please",
+) if message not in _INTENT_MESSAGES)
+
+# Messages for the confidence checks in TestGPT4oIntentClassification
+_CONFIDENCE_RANGE_MESSAGES = (
+    "I forgot my password",
+    "The elevator is broken",
+    "I want to appeal my grade",
+    "asdfghjkl random text",
+)
+_AMBIGUOUS_MESSAGES = ("help", "problem", "question", "asdfghjkl")
+
+# Accuracy metric sample, stored column-wise so scoring is one comparison
+# pass per field: (message, expected_intent_category, expected_department)
+_ACCURACY_CASES = (
+    ("I forgot my password", "ACCOUNT_ACCESS", "IT"),
+    ("Can't log into Canvas", "ACCOUNT_ACCESS", "IT"),
+    ("I need a transcript", "ACADEMIC_RECORDS", "REGISTRAR"),
+    ("When will my financial aid come?", "FINANCIAL", "FINANCIAL_AID"),
+    ("The elevator is broken", "FACILITIES", "FACILITIES"),
+    ("I lost my ID", "STUDENT_SERVICES", "STUDENT_AFFAIRS"),
+    ("I want to appeal my grade", "POLICY_EXCEPTION", "ESCALATE_TO_HUMAN"),
+    ("I need to talk to a person", "HUMAN_REQUEST", "ESCALATE_TO_HUMAN"),
+)
+_ACCURACY_MESSAGES, _ACCURACY_CATEGORIES, _ACCURACY_DEPTS = zip(*_ACCURACY_CASES)
+
+# Wording an escalation response should use for human follow-up
+_ESC_WORDS_RE = re.compile(r"\b(?:human|staff|team|person|someone)\b", re.IGNORECASE)
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
-def gpt4o_service():
-    """Create Azure OpenAI LLM service instance."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def azure_http_client():
+    """Share one pooled HTTP client so evals reuse keep-alive TLS connections."""
+    client = httpx.AsyncClient(timeout=30.0)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(scope="session")
+def gpt4o_service(azure_http_client, _test_env):
+    """Create Azure OpenAI LLM service instance (stateless, shared per session).
+
+    Session fixtures are built before the per-test ``real_openai`` restore,
+    so the real credentials are read from ``_test_env`` rather than os.environ.
+    """
     from app.services.azure.llm_service import AzureOpenAILLMService
 
-    endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT", "")
-    api_key = os.environ.get("AZURE_OPENAI_API_KEY", "")
-    deployment = os.environ.get("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+    endpoint = _test_env.get("AZURE_OPENAI_ENDPOINT") or ""
+    api_key = _test_env.get("AZURE_OPENAI_API_KEY") or ""
+    deployment = _test_env.get("AZURE_OPENAI_DEPLOYMENT") or "gpt-4o"
     api_version = os.environ.get("AZURE_OPENAI_API_VERSION", "2024-05-01-preview")
 
     service = AzureOpenAILLMService(
@@ -166,24 +281,227 @@ def gpt4o_service():
         api_key=api_key,
         deployment=deployment,
         api_version=api_version,
+        client=azure_http_client,
     )
     yield service
 
 
+@pytest.fixture(scope="session")
+def llm_response_cache():
+    """Open the on-disk completion cache named by LLM_EVAL_CACHE_PATH, if set.
+
+    Reruns against an unchanged prompt and deployment then skip the API.
+    """
+    path = os.environ.get("LLM_EVAL_CACHE_PATH")
+    if not path:
+        yield None
+        return
+    # WAL plus a busy timeout lets concurrent xdist workers or CI shards
+    # share one cache file; sqlite's own file locking serializes writers.
+    conn = sqlite3.connect(path, timeout=30.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, response BLOB NOT NULL)"
+    )
+    yield conn
+    conn.close()
+
+
+# Messages naming one of these unambiguous systems or services are answered
+# by the deterministic mock classifier when pytest runs with --fast.
+_FAST_PATH_RE = re.compile(
+    r"\b(password|canvas|vpn|wifi|transcripts?|fafsa|elevator)\b", re.IGNORECASE
+)
+
+
+@pytest.fixture(scope="session")
+def cached_gpt4o_service(request, gpt4o_service, llm_response_cache):
+    """GPT-4o service for the classification evals, with optional shortcuts.
+
+    Context-free classify calls are coalesced by message: concurrent callers
+    await one task, and later callers reuse its result for the session.
+
+    With LLM_EVAL_CACHE_PATH set, completions are served from the disk cache.
+    The key hashes deployment, API version and the full request, including
+    the system prompt, so prompt edits invalidate entries automatically.
+    Failed calls raise before anything is stored.
+
+    With --fast, context-free messages matching _FAST_PATH_RE skip the API
+    and are classified by MockLLMService. This trades eval fidelity for
+    speed and is meant for local iteration only.
+
+    Timing and health tests keep using the plain ``gpt4o_service``.
+    """
+    service = copy.copy(gpt4o_service)
+
+    if llm_response_cache is not None:
+        call_openai = gpt4o_service._call_openai
+        prefix = f"{service.deployment}|{service.api_version}|".encode()
+
+        async def cached_call_openai(messages, max_tokens=1000, temperature=0.1):
+            payload = orjson.dumps(
+                [messages, max_tokens, temperature], option=orjson.OPT_SORT_KEYS
+            )
+            key = hashlib.sha256(prefix + payload).hexdigest()
+            row = llm_response_cache.execute(
+                "SELECT response FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                return orjson.loads(row[0])
+            response = await call_openai(messages, max_tokens=max_tokens, temperature=temperature)
+            with llm_response_cache:
+                llm_response_cache.execute(
+                    "INSERT OR REPLACE INTO completions VALUES (?, ?)",
+                    (key, orjson.dumps(response)),
+                )
+            return response
+
+        service._call_openai = cached_call_openai
+
+    # Bound to the copy, so calls go through its (possibly cached) _call_openai
+    classify_intent = service.classify_intent
+
+    if request.config.getoption("--fast"):
+        from app.services.mock.llm_service import MockLLMService
+
+        preclassifier = MockLLMService()
+        api_classify_intent = classify_intent
+
+        async def classify_intent(message, conversation_history=None):
+            if not conversation_history and _FAST_PATH_RE.search(message):
+                return preclassifier.classify_intent_sync(message)
+            return await api_classify_intent(message, conversation_history)
+
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def coalesced_classify_intent(message, conversation_history=None):
+        if conversation_history:
+            return await classify_intent(message, conversation_history)
+        task = tasks.get(message)
+        if task is None:
+            task = tasks[message] = asyncio.ensure_future(classify_intent(message))
+        try:
+            # Shielded so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+        except Exception:
+            # Drop the failed call so a later caller can retry
+            if tasks.get(message) is task:
+                del tasks[message]
+            raise
+
+    service.classify_intent = coalesced_classify_intent
+    return service
+
+
+# Upper bound on in-flight classification calls when prefetching the case
+# tables, to stay under the deployment's rate limit.
+_PREFETCH_CONCURRENCY = 8
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def classified_cases(cached_gpt4o_service) -> dict:
+    """Classify every case-table and confidence message concurrently, once per session.
+
+    Maps message to its QueryResult, or to the exception the call raised so
+    only the affected cases fail. Messages shared between tables are
+    classified once.
+    """
+    table_messages = (
+        case[0]
+        for table in (
+            INTENT_CLASSIFICATION_CASES,
+            PII_DETECTION_CASES,
+            SENTIMENT_DETECTION_CASES,
+            ENTITY_EXTRACTION_CASES,
+            URGENCY_INDICATOR_CASES,
+        )
+        for case in table
+    )
+    messages = list(dict.fromkeys(
+        itertools.chain(table_messages, _CONFIDENCE_RANGE_MESSAGES, _AMBIGUOUS_MESSAGES)
+    ))
+    semaphore = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+    async def classify(message: str):
+        async with semaphore:
+            return await cached_gpt4o_service.classify_intent(message)
+
+    results = await asyncio.gather(
+        *(classify(message) for message in messages), return_exceptions=True
+    )
+    return dict(zip(messages, results))
+
+
+def _classified(classified_cases: dict, message: str):
+    """Return the prefetched result for a case, re-raising a failed call."""
+    result = classified_cases[message]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 @pytest.fixture
+def classified(message: str, classified_cases: dict):
+    """Prefetched QueryResult for the test's parametrized ``message``.
+
+    Every class parametrized over ``message`` shares the one session-wide
+    classification per unique message.
+    """
+    return _classified(classified_cases, message)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_loop():
+    """The event loop the session-scoped async fixtures run on."""
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture(scope="module")
+def coalesced_results() -> dict:
+    """Results the coalescing check got for one message, keyed by calling test."""
+    return {}
+
+
+@pytest.fixture(scope="session")
 def settings():
-    """Create settings for router agent."""
+    """Create settings for router agent (routing thresholds only, shared per session)."""
     from app.core.config import Settings
     return Settings()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def router_agent(settings):
-    """Create router agent instance."""
+    """Create router agent instance; route() is stateless, so one serves every test."""
     from app.agents.router_agent import RouterAgent
     return RouterAgent(settings)
 
 
+# =============================================================================
+# Session Loop Tests
+# =============================================================================
+
+class TestGPT4oSessionLoop:
+    """Check that tests share the loop that prefetched and coalesced calls run on."""
+
+    async def test_tests_share_the_prefetch_loop(self, session_loop, classified_cases):
+        """The prefetch, the pooled client and each test share one event loop."""
+        assert classified_cases
+        assert asyncio.get_running_loop() is session_loop
+
+    # Not in any case table, so the first test here starts the shared call
+    _COALESCED_MESSAGE = "I can't reset my password from the portal"
+
+    @pytest.mark.parametrize("caller", ["first", "second"])
+    async def test_coalesced_call_is_awaited_across_tests(
+        self, cached_gpt4o_service, coalesced_results, caller: str
+    ):
+        """A classification started by one test is reused by a later test."""
+        result = await cached_gpt4o_service.classify_intent(self._COALESCED_MESSAGE)
+        coalesced_results[caller] = result
+        if caller == "second":
+            assert result is coalesced_results["first"]
+
+
 # =============================================================================
 # Intent Classification Tests
 # =============================================================================
@@ -191,77 +509,48 @@ def router_agent(settings):
 class TestGPT4oIntentClassification:
     """Evaluate GPT-4o intent classification accuracy."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_category,expected_dept,should_escalate", INTENT_CLASSIFICATION_CASES)
+    @pytest.mark.parametrize(
+        "message,expected_category,expected_dept,should_escalate",
+        INTENT_CLASSIFICATION_CASES,
+        ids=_INTENT_IDS,
+    )
     async def test_intent_classification(
         self,
-        gpt4o_service,
+        classified,
         message: str,
-        expected_category,
-        expected_dept,
+        expected_category: frozenset[str],
+        expected_dept: frozenset[str],
         should_escalate: bool,
     ):
         """Test that GPT-4o correctly classifies intent and routes to department."""
-        result = await gpt4o_service.classify_intent(message)
-
-        # Check intent category (allow list for ambiguous cases)
-        if isinstance(expected_category, list):
-            assert result.intent_category.value in expected_category, (
-                f"Message '{message}' - expected category in {expected_category}, "
-                f"got {result.intent_category.value}"
-            )
-        else:
-            assert result.intent_category.value == expected_category, (
-                f"Message '{message}' - expected category {expected_category}, "
-                f"got {result.intent_category.value}"
-            )
-
-        # Check department (allow list for ambiguous cases)
-        if isinstance(expected_dept, list):
-            assert result.department_suggestion.value in expected_dept, (
-                f"Message '{message}' - expected dept in {expected_dept}, "
-                f"got {result.department_suggestion.value}"
-            )
-        else:
-            assert result.department_suggestion.value == expected_dept, (
-                f"Message '{message}' - expected dept {expected_dept}, "
-                f"got {result.department_suggestion.value}"
-            )
+        # Check intent category and department against the accepted sets
+        assert classified.intent_category.value in expected_category, (
+            f"Message '{message}' - expected category in {sorted(expected_category)}, "
+            f"got {classified.intent_category.value}"
+        )
+        assert classified.department_suggestion.value in expected_dept, (
+            f"Message '{message}' - expected dept in {sorted(expected_dept)}, "
+            f"got {classified.department_suggestion.value}"
+        )
 
         # Check escalation
-        assert result.requires_escalation == should_escalate, (
+        assert classified.requires_escalation == should_escalate, (
             f"Message '{message}' - expected escalation={should_escalate}, "
-            f"got {result.requires_escalation}"
+            f"got {classified.requires_escalation}"
         )
 
-    @pytest.mark.asyncio
-    async def test_confidence_score_range(self, gpt4o_service):
+    async def test_confidence_score_range(self, classified_cases):
         """Test that confidence scores are in valid range [0, 1]."""
-        messages = [
-            "I forgot my password",
-            "The elevator is broken",
-            "I want to appeal my grade",
-            "asdfghjkl random text",
-        ]
-
-        for message in messages:
-            result = await gpt4o_service.classify_intent(message)
+        for message in _CONFIDENCE_RANGE_MESSAGES:
+            result = _classified(classified_cases, message)
             assert 0.0 <= result.confidence <= 1.0, (
                 f"Confidence {result.confidence} out of range for '{message}'"
             )
 
-    @pytest.mark.asyncio
-    async def test_low_confidence_for_ambiguous(self, gpt4o_service):
+    async def test_low_confidence_for_ambiguous(self, classified_cases):
         """Test that ambiguous messages have lower confidence."""
-        ambiguous_messages = [
-            "help",
-            "problem",
-            "question",
-            "asdfghjkl",
-        ]
-
-        for message in ambiguous_messages:
-            result = await gpt4o_service.classify_intent(message)
+        for message in _AMBIGUOUS_MESSAGES:
+            result = _classified(classified_cases, message)
             # Ambiguous messages should generally have confidence < 0.9
             assert result.confidence < 0.95, (
                 f"Ambiguous message '{message}' should have lower confidence, "
@@ -276,19 +565,12 @@ class TestGPT4oIntentClassification:
 class TestGPT4oEscalationDetection:
     """Evaluate GPT-4o escalation detection accuracy."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_depts", [
-        ("I want to appeal my grade", ["ESCALATE_TO_HUMAN"]),
-        ("Can I get a refund?", ["ESCALATE_TO_HUMAN"]),
-        ("I need a tuition waiver", ["ESCALATE_TO_HUMAN"]),
-        ("I'm requesting an exception", ["ESCALATE_TO_HUMAN"]),
-        ("Can you override this requirement?", ["ESCALATE_TO_HUMAN"]),
-        # Late withdrawal may route to REGISTRAR or ESCALATE_TO_HUMAN depending on LLM interpretation
-        ("I want to withdraw after the deadline", ["ESCALATE_TO_HUMAN", "REGISTRAR"]),
-    ])
-    async def test_policy_keyword_escalation(self, gpt4o_service, message: str, expected_depts: list):
+    @pytest.mark.parametrize("message,expected_depts", _POLICY_ESCALATION_CASES)
+    async def test_policy_keyword_escalation(
+        self, cached_gpt4o_service, message: str, expected_depts: tuple[str, ...]
+    ):
         """Test escalation for policy keywords."""
-        result = await gpt4o_service.classify_intent(message)
+        result = await cached_gpt4o_service.classify_intent(message)
         assert result.requires_escalation is True, (
             f"Policy message '{message}' should require escalation"
         )
@@ -297,34 +579,18 @@ class TestGPT4oEscalationDetection:
             f"got {result.department_suggestion.value}"
         )
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I need to report a Title IX incident",
-        "I'm being sexually harassed",
-        "I'm feeling suicidal",
-        "I'm having a mental health crisis",
-        "Someone threatened to hurt me",
-        "There's been a violent incident",
-    ])
-    async def test_sensitive_topic_escalation(self, gpt4o_service, message: str):
+    @pytest.mark.parametrize("message", _SENSITIVE_ESCALATION_MESSAGES)
+    async def test_sensitive_topic_escalation(self, cached_gpt4o_service, message: str):
         """Test escalation for sensitive topics."""
-        result = await gpt4o_service.classify_intent(message)
+        result = await cached_gpt4o_service.classify_intent(message)
         assert result.requires_escalation is True, (
             f"Sensitive message '{message}' should require escalation"
         )
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I want to talk to a real person",
-        "Can I speak with someone?",
-        "Transfer me to a human",
-        "I need to speak with an agent",
-        "Let me talk to a person",
-        "Human please",
-    ])
-    async def test_explicit_human_request_escalation(self, gpt4o_service, message: str):
+    @pytest.mark.parametrize("message", _HUMAN_REQUEST_MESSAGES)
+    async def test_explicit_human_request_escalation(self, cached_gpt4o_service, message: str):
         """Test escalation for explicit human requests."""
-        result = await gpt4o_service.classify_intent(message)
+        result = await cached_gpt4o_service.classify_intent(message)
         assert result.requires_escalation is True, (
             f"Human request '{message}' should require escalation"
         )
@@ -338,32 +604,30 @@ class TestGPT4oEscalationDetection:
 class TestGPT4oPIIDetection:
     """Evaluate GPT-4o PII detection accuracy."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,should_detect,expected_types", PII_DETECTION_CASES)
+    @pytest.mark.parametrize(
+        "message,should_detect,expected_types", PII_DETECTION_CASES, ids=_PII_IDS
+    )
     async def test_pii_detection(
         self,
-        gpt4o_service,
+        classified,
         message: str,
         should_detect: bool,
-        expected_types: list,
+        expected_types: tuple[str, ...],
     ):
         """Test PII detection accuracy."""
-        result = await gpt4o_service.classify_intent(message)
-
-        assert result.pii_detected == should_detect, (
+        assert classified.pii_detected == should_detect, (
             f"Message '{message}' - expected pii_detected={should_detect}, "
-            f"got {result.pii_detected}"
+            f"got {classified.pii_detected}"
         )
 
         if expected_types:
             for pii_type in expected_types:
-                assert pii_type in result.pii_types, (
+                assert pii_type in classified.pii_types, (
                     f"Message '{message}' should detect PII type '{pii_type}', "
-                    f"got {result.pii_types}"
+                    f"got {classified.pii_types}"
                 )
 
-    @pytest.mark.asyncio
-    async def test_no_false_positive_pii(self, gpt4o_service):
+    async def test_no_false_positive_pii(self, cached_gpt4o_service):
         """Test that normal messages don't trigger false PII detection."""
         safe_messages = [
             "I forgot my password",
@@ -373,8 +637,10 @@ class TestGPT4oPIIDetection:
             "What are the library hours?",
         ]
 
-        for message in safe_messages:
-            result = await gpt4o_service.classify_intent(message)
+        results = await asyncio.gather(
+            *(cached_gpt4o_service.classify_intent(message) for message in safe_messages)
+        )
+        for message, result in zip(safe_messages, results):
             assert result.pii_detected is False, (
                 f"Safe message '{message}' should not detect PII"
             )
@@ -387,20 +653,19 @@ class TestGPT4oPIIDetection:
 class TestGPT4oSentimentDetection:
     """Evaluate GPT-4o sentiment detection accuracy."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_sentiment", SENTIMENT_DETECTION_CASES)
+    @pytest.mark.parametrize(
+        "message,expected_sentiment", SENTIMENT_DETECTION_CASES, ids=_SENTIMENT_IDS
+    )
     async def test_sentiment_detection(
         self,
-        gpt4o_service,
+        classified,
         message: str,
         expected_sentiment: str,
     ):
         """Test sentiment detection accuracy."""
-        result = await gpt4o_service.classify_intent(message)
-
-        assert result.sentiment.value == expected_sentiment, (
+        assert classified.sentiment.value == expected_sentiment, (
             f"Message '{message}' - expected sentiment {expected_sentiment}, "
-            f"got {result.sentiment.value}"
+            f"got {classified.sentiment.value}"
         )
 
 
@@ -411,25 +676,27 @@ class TestGPT4oSentimentDetection:
 class TestGPT4oEntityExtraction:
     """Evaluate GPT-4o entity extraction accuracy."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_entities", ENTITY_EXTRACTION_CASES)
+    @pytest.mark.parametrize(
+        "message,expected_entities", ENTITY_EXTRACTION_CASES, ids=_ENTITY_IDS
+    )
     async def test_entity_extraction(
         self,
-        gpt4o_service,
+        classified,
         message: str,
         expected_entities: dict,
     ):
         """Test entity extraction accuracy."""
-        result = await gpt4o_service.classify_intent(message)
+        # Lowercase the extracted values once for the containment checks
+        lowered = {key: str(value).lower() for key, value in classified.entities.items()}
 
         for entity_type, expected_value in expected_entities.items():
-            assert entity_type in result.entities, (
+            assert entity_type in lowered, (
                 f"Message '{message}' should extract entity '{entity_type}'"
             )
             # Check if the expected value is contained in the extracted value
             # (to allow for slight variations in extraction)
-            extracted = result.entities.get(entity_type, "")
-            assert expected_value.lower() in extracted.lower(), (
+            extracted = classified.entities[entity_type]
+            assert expected_value.lower() in lowered[entity_type], (
                 f"Message '{message}' - entity '{entity_type}' expected to contain "
                 f"'{expected_value}', got '{extracted}'"
             )
@@ -442,32 +709,33 @@ class TestGPT4oEntityExtraction:
 class TestGPT4oUrgencyDetection:
     """Evaluate GPT-4o urgency indicator detection."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_indicators", URGENCY_INDICATOR_CASES)
+    @pytest.mark.parametrize(
+        "message,expected_indicators", URGENCY_INDICATOR_CASES, ids=_URGENCY_IDS
+    )
     async def test_urgency_indicator_detection(
         self,
-        gpt4o_service,
+        classified,
         message: str,
-        expected_indicators: list,
+        expected_indicators: tuple[str, ...],
     ):
         """Test urgency indicator detection."""
-        result = await gpt4o_service.classify_intent(message)
-
         if expected_indicators:
-            assert len(result.urgency_indicators) > 0, (
+            assert len(classified.urgency_indicators) > 0, (
                 f"Message '{message}' should detect urgency indicators"
             )
+            # Lowercase the detected indicators once; newline-joined so a
+            # substring match cannot span two indicators
+            detected = "\n".join(classified.urgency_indicators).lower()
             for indicator in expected_indicators:
-                found = any(indicator.lower() in ind.lower() for ind in result.urgency_indicators)
-                assert found, (
+                assert indicator.lower() in detected, (
                     f"Message '{message}' should detect urgency indicator '{indicator}', "
-                    f"got {result.urgency_indicators}"
+                    f"got {classified.urgency_indicators}"
                 )
         else:
             # Empty expected means no urgency indicators should be detected
-            assert len(result.urgency_indicators) == 0, (
+            assert len(classified.urgency_indicators) == 0, (
                 f"Message '{message}' should not detect urgency indicators, "
-                f"got {result.urgency_indicators}"
+                f"got {classified.urgency_indicators}"
             )
 
 
@@ -478,7 +746,6 @@ class TestGPT4oUrgencyDetection:
 class TestGPT4oResponseGeneration:
     """Evaluate GPT-4o response generation quality."""
 
-    @pytest.mark.asyncio
     async def test_clarification_question_generation(self, gpt4o_service):
         """Test clarification question generation."""
         message = "I have a problem"
@@ -494,7 +761,6 @@ class TestGPT4oResponseGeneration:
         # Should be asking a question
         assert "?" in clarification, "Clarification should include a question"
 
-    @pytest.mark.asyncio
     async def test_response_message_generation(self, gpt4o_service):
         """Test response message generation."""
         from app.models.enums import Department
@@ -518,7 +784,6 @@ class TestGPT4oResponseGeneration:
         assert len(response) > 0, "Response should not be empty"
         assert len(response) < 2000, "Response should be reasonably concise"
 
-    @pytest.mark.asyncio
     async def test_escalation_response_message(self, gpt4o_service):
         """Test response message for escalated tickets."""
         from app.models.enums import Department
@@ -534,8 +799,7 @@ class TestGPT4oResponseGeneration:
 
         assert len(response) > 0, "Response should not be empty"
         # Should mention human/staff follow-up
-        response_lower = response.lower()
-        assert any(word in response_lower for word in ["human", "staff", "team", "person", "someone"]), (
+        assert _ESC_WORDS_RE.search(response), (
             "Escalation response should mention human follow-up"
         )
 
@@ -547,8 +811,7 @@ class TestGPT4oResponseGeneration:
 class TestGPT4oEndToEndPipeline:
     """Test complete agent pipeline with GPT-4o."""
 
-    @pytest.mark.asyncio
-    async def test_full_classification_and_routing(self, gpt4o_service, router_agent):
+    async def test_full_classification_and_routing(self, cached_gpt4o_service, router_agent):
         """Test full classification and routing pipeline."""
         test_cases = [
             ("I forgot my password", "IT", False),
@@ -556,10 +819,14 @@ class TestGPT4oEndToEndPipeline:
             ("I want to appeal my grade", "ESCALATE_TO_HUMAN", True),
         ]
 
-        for message, expected_dept, expected_escalation in test_cases:
-            # Step 1: Classify with GPT-4o
-            query_result = await gpt4o_service.classify_intent(message)
+        # Step 1: Classify with GPT-4o (network-bound, so overlap the calls)
+        query_results = await asyncio.gather(
+            *(cached_gpt4o_service.classify_intent(message) for message, _, _ in test_cases)
+        )
 
+        for (message, expected_dept, expected_escalation), query_result in zip(
+            test_cases, query_results
+        ):
             # Step 2: Route
             routing_decision = router_agent.route(query_result)
 
@@ -572,11 +839,10 @@ class TestGPT4oEndToEndPipeline:
                 f"Message '{message}' escalation mismatch"
             )
 
-    @pytest.mark.asyncio
-    async def test_conversation_context(self, gpt4o_service):
+    async def test_conversation_context(self, cached_gpt4o_service):
         """Test that conversation history affects classification."""
         # First message
-        result1 = await gpt4o_service.classify_intent("I have a problem")
+        result1 = await cached_gpt4o_service.classify_intent("I have a problem")
 
         # Follow-up with context
         history = [
@@ -584,7 +850,7 @@ class TestGPT4oEndToEndPipeline:
             {"role": "assistant", "content": "I'd be happy to help. What kind of problem are you experiencing?"},
         ]
 
-        result2 = await gpt4o_service.classify_intent(
+        result2 = await cached_gpt4o_service.classify_intent(
             "It's with my Canvas account",
             conversation_history=history,
         )
@@ -602,19 +868,15 @@ class TestGPT4oEndToEndPipeline:
 class TestGPT4oPerformance:
     """Test GPT-4o response time and reliability."""
 
-    @pytest.mark.asyncio
     async def test_classification_response_time(self, gpt4o_service):
         """Test that classification completes within acceptable time."""
-        import time
-
-        start = time.time()
+        start = perf_counter_ns()
         await gpt4o_service.classify_intent("I forgot my password")
-        elapsed = time.time() - start
+        elapsed = perf_counter_ns() - start
 
         # Classification should complete within 10 seconds
-        assert elapsed < 10, f"Classification took {elapsed:.2f}s, expected < 10s"
+        assert elapsed < 10e9, f"Classification took {elapsed / 1e9:.2f}s, expected < 10s"
 
-    @pytest.mark.asyncio
     async def test_health_check(self, gpt4o_service):
         """Test health check endpoint."""
         healthy, latency_ms, error = await gpt4o_service.health_check()
@@ -623,11 +885,8 @@ class TestGPT4oPerformance:
         assert latency_ms is not None, "Latency should be reported"
         assert latency_ms < 5000, f"Health check latency {latency_ms}ms too high"
 
-    @pytest.mark.asyncio
     async def test_multiple_concurrent_requests(self, gpt4o_service):
         """Test handling multiple concurrent classification requests."""
-        import asyncio
-
         messages = [
             "I forgot my password",
             "The elevator is broken",
@@ -654,32 +913,18 @@ class TestGPT4oPerformance:
 class TestGPT4oAccuracyMetrics:
     """Calculate and report accuracy metrics."""
 
-    @pytest.mark.asyncio
-    async def test_overall_classification_accuracy(self, gpt4o_service):
+    async def test_overall_classification_accuracy(self, cached_gpt4o_service):
         """Calculate overall intent classification accuracy."""
-        # Sample of test cases for accuracy measurement
-        test_cases = [
-            ("I forgot my password", "ACCOUNT_ACCESS", "IT"),
-            ("Can't log into Canvas", "ACCOUNT_ACCESS", "IT"),
-            ("I need a transcript", "ACADEMIC_RECORDS", "REGISTRAR"),
-            ("When will my financial aid come?", "FINANCIAL", "FINANCIAL_AID"),
-            ("The elevator is broken", "FACILITIES", "FACILITIES"),
-            ("I lost my ID", "STUDENT_SERVICES", "STUDENT_AFFAIRS"),
-            ("I want to appeal my grade", "POLICY_EXCEPTION", "ESCALATE_TO_HUMAN"),
-            ("I need to talk to a person", "HUMAN_REQUEST", "ESCALATE_TO_HUMAN"),
-        ]
-
-        category_correct = 0
-        department_correct = 0
-        total = len(test_cases)
-
-        for message, expected_category, expected_dept in test_cases:
-            result = await gpt4o_service.classify_intent(message)
-
-            if result.intent_category.value == expected_category:
-                category_correct += 1
-            if result.department_suggestion.value == expected_dept:
-                department_correct += 1
+        results = await asyncio.gather(
+            *(cached_gpt4o_service.classify_intent(message) for message in _ACCURACY_MESSAGES)
+        )
+        total = len(results)
+        category_correct = sum(map(
+            operator.eq, (r.intent_category.value for r in results), _ACCURACY_CATEGORIES
+        ))
+        department_correct = sum(map(
+            operator.eq, (r.department_suggestion.value for r in results), _ACCURACY_DEPTS
+        ))
 
         category_accuracy = category_correct / total
         department_accuracy = department_correct / total
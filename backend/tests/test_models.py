@@ -3,18 +3,19 @@ Tests for data models and schemas.
 """
 
 import pytest
-from datetime import datetime, timezone
-from uuid import uuid4
 
-from app.models.enums import (
+from pydantic import BaseModel, ValidationError
+
+import app.models
+from app.models import (
+    # Enums
     ActionStatus,
     Department,
     EscalationReason,
     IntentCategory,
     Priority,
     Sentiment,
-)
-from app.models.schemas import (
+    # Schemas
     ChatRequest,
     ChatResponse,
     QueryResult,
@@ -25,6 +26,7 @@ from app.models.schemas import (
     ConversationTurn,
     AuditLog,
 )
+from tests.constants import HASH_A, HASH_B, LOG_ID, NOW, SESSION_ID
 
 
 class TestEnums:
@@ -61,19 +63,18 @@ class TestChatRequest:
 
     def test_request_with_session(self):
         """Test chat request with session ID."""
-        session_id = uuid4()
-        request = ChatRequest(message="Follow up", session_id=session_id)
-        assert request.session_id == session_id
+        request = ChatRequest(message="Follow up", session_id=SESSION_ID)
+        assert request.session_id == SESSION_ID
 
     def test_message_min_length(self):
         """Test message minimum length validation."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="message"):
             ChatRequest(message="")
 
     def test_message_max_length(self):
         """Test message maximum length validation."""
         long_message = "x" * 2001
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="message"):
             ChatRequest(message=long_message)
 
 
@@ -93,7 +94,7 @@ class TestKnowledgeArticle:
 
     def test_relevance_score_range(self):
         """Test relevance score must be between 0 and 1."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="relevance_score"):
             KnowledgeArticle(
                 article_id="kb-001",
                 title="Test",
@@ -108,7 +109,7 @@ class TestChatResponse:
     def test_valid_response(self):
         """Test creating a valid chat response."""
         response = ChatResponse(
-            session_id=uuid4(),
+            session_id=SESSION_ID,
             ticket_id="TKT-IT-20260120-0001",
             department=Department.IT,
             status=ActionStatus.CREATED,
@@ -121,7 +122,7 @@ class TestChatResponse:
     def test_valid_ticket_id_format(self):
         """Test valid ticket ID format is accepted."""
         response = ChatResponse(
-            session_id=uuid4(),
+            session_id=SESSION_ID,
             ticket_id="TKT-REG-20260120-0042",
             status=ActionStatus.CREATED,
             message="Created",
@@ -131,15 +132,26 @@ class TestChatResponse:
 
     def test_invalid_ticket_id_format(self):
         """Test invalid ticket ID format is rejected."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="ticket_id"):
             ChatResponse(
-                session_id=uuid4(),
+                session_id=SESSION_ID,
                 ticket_id="INVALID-ID",
                 status=ActionStatus.CREATED,
                 message="Created",
                 escalated=False,
             )
 
+    def test_ticket_id_with_trailing_newline_rejected(self):
+        """Test a valid ticket ID followed by a newline is rejected."""
+        with pytest.raises(ValidationError, match="ticket_id"):
+            ChatResponse(
+                session_id=SESSION_ID,
+                ticket_id="TKT-IT-20260120-0001\n",
+                status=ActionStatus.CREATED,
+                message="Created",
+                escalated=False,
+            )
+
 
 class TestQueryResult:
     """Test QueryResult schema."""
@@ -158,7 +170,7 @@ class TestQueryResult:
 
     def test_confidence_range(self):
         """Test confidence must be between 0 and 1."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="confidence"):
             QueryResult(
                 intent="test",
                 intent_category=IntentCategory.GENERAL_INQUIRY,
@@ -183,7 +195,7 @@ class TestRoutingDecision:
 
     def test_escalation_requires_reason(self):
         """Test escalation requires a reason."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="escalation_reason"):
             RoutingDecision(
                 department=Department.ESCALATE_TO_HUMAN,
                 priority=Priority.URGENT,
@@ -210,36 +222,33 @@ class TestSession:
 
     def test_valid_session(self):
         """Test creating a valid session."""
-        now = datetime.now(timezone.utc)
         session = Session(
-            session_id=uuid4(),
-            student_id_hash="a" * 64,  # SHA-256 hash is 64 chars
-            created_at=now,
-            last_active=now,
+            session_id=SESSION_ID,
+            student_id_hash=HASH_A,  # SHA-256 hash is 64 chars
+            created_at=NOW,
+            last_active=NOW,
         )
         assert session.clarification_attempts == 0
         assert session.ttl == 7776000
 
     def test_student_id_hash_length(self):
         """Test student ID hash must be 64 characters."""
-        now = datetime.now(timezone.utc)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="student_id_hash"):
             Session(
-                session_id=uuid4(),
+                session_id=SESSION_ID,
                 student_id_hash="tooshort",
-                created_at=now,
-                last_active=now,
+                created_at=NOW,
+                last_active=NOW,
             )
 
     def test_clarification_attempts_max(self):
         """Test clarification attempts maximum."""
-        now = datetime.now(timezone.utc)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="clarification_attempts"):
             Session(
-                session_id=uuid4(),
-                student_id_hash="a" * 64,
-                created_at=now,
-                last_active=now,
+                session_id=SESSION_ID,
+                student_id_hash=HASH_A,
+                created_at=NOW,
+                last_active=NOW,
                 clarification_attempts=5,  # Max is 3
             )
 
@@ -249,12 +258,11 @@ class TestAuditLog:
 
     def test_valid_audit_log(self):
         """Test creating a valid audit log."""
-        now = datetime.now(timezone.utc)
         log = AuditLog(
-            log_id=uuid4(),
-            timestamp=now,
-            student_id_hash="b" * 64,
-            session_id=uuid4(),
+            log_id=LOG_ID,
+            timestamp=NOW,
+            student_id_hash=HASH_B,
+            session_id=SESSION_ID,
             detected_intent="password_reset",
             confidence_score=0.92,
             routed_department=Department.IT,
@@ -268,13 +276,12 @@ class TestAuditLog:
 
     def test_escalation_requires_reason_in_audit(self):
         """Test escalated audit log requires reason."""
-        now = datetime.now(timezone.utc)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="escalation_reason"):
             AuditLog(
-                log_id=uuid4(),
-                timestamp=now,
-                student_id_hash="b" * 64,
-                session_id=uuid4(),
+                log_id=LOG_ID,
+                timestamp=NOW,
+                student_id_hash=HASH_B,
+                session_id=SESSION_ID,
                 detected_intent="test",
                 confidence_score=0.5,
                 routed_department=Department.ESCALATE_TO_HUMAN,
@@ -284,3 +291,20 @@ class TestAuditLog:
                 sentiment=Sentiment.FRUSTRATED,
                 response_time_ms=200,
             )
+
+
+class TestSchemaBuild:
+    """Test schema construction happens at import."""
+
+    def test_models_are_built_at_import(self):
+        """Test no model defers its validator build to first instantiation."""
+        models = [
+            getattr(app.models, name) for name in app.models.__all__
+        ]
+        deferred = [
+            model.__name__
+            for model in models
+            if isinstance(model, type) and issubclass(model, BaseModel)
+            and not model.__pydantic_complete__
+        ]
+        assert not deferred, f"Models with deferred builds: {deferred}"
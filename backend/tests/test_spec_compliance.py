@@ -8,23 +8,24 @@ These tests verify compliance with requirements from spec.md:
 - User Stories (US1-US5) acceptance scenarios
 """
 
+import asyncio
 import re
 import time
-from datetime import datetime, timezone
+from functools import cache
 from typing import Optional
-from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
-from app.models.enums import (
+from app.models import (
+    # Enums
     ActionStatus,
     Department,
     EscalationReason,
     IntentCategory,
     Priority,
     Sentiment,
-)
-from app.models.schemas import (
+    # Schemas
     ActionResult,
     AuditLog,
     ChatRequest,
@@ -35,6 +36,281 @@ from app.models.schemas import (
     RoutingDecision,
     Session,
 )
+from tests.constants import HASH_A, LOG_ID, NOW, SESSION_ID
+
+# Every test here is microsecond-scale and I/O-free, so fanning the module
+# out across xdist workers only repeats session fixture setup per worker.
+# Keep it on one worker; other modules still spread over the rest. Async
+# tests need no per-test mark under asyncio_mode = "auto".
+pytestmark = pytest.mark.xdist_group("spec_compliance")
+
+# Ticket ID format from spec.md, cross-checked against the schema validators
+_TICKET_ID_RE = re.compile(r"TKT-[A-Z]{2,3}-\d{8}-\d{4}", re.ASCII)
+
+# Wording expected in escalation and SLA responses
+_HUMAN_RE = re.compile(r"human|team member|specialist|staff|person", re.IGNORECASE)
+_TIME_RE = re.compile(r"hour|day|business|within|expect", re.IGNORECASE)
+
+# Models that validate ticket_id, with the other fields each one requires
+_TICKET_MODELS = {
+    "chat_response": (ChatResponse, {
+        "session_id": SESSION_ID,
+        "status": ActionStatus.CREATED,
+        "message": "Created",
+        "escalated": False,
+    }),
+    "action_result": (ActionResult, {
+        "department": Department.IT,
+        "status": ActionStatus.CREATED,
+        "estimated_response_time": "4 hours",
+        "user_message": "Created",
+    }),
+}
+
+# A maximum-length (50 turn) history, validated once at import. Session keeps
+# already-built turns as-is, so tests can share these read-only instances.
+_FULL_HISTORY = tuple(
+    ConversationTurn(
+        turn_number=i + 1,
+        timestamp=NOW,
+        intent="password_reset",
+        escalated=False,
+    )
+    for i in range(50)
+)
+
+
+# Requirement tables. Each is asserted in full by a batched test that
+# classifies every row concurrently; a slow-marked parametrized variant per
+# requirement reports each row separately (run with -m slow).
+CASES_FR001 = [
+    ("I forgot my password", IntentCategory.ACCOUNT_ACCESS),
+    ("Can't log into Canvas", IntentCategory.ACCOUNT_ACCESS),
+    ("My account is locked", IntentCategory.ACCOUNT_ACCESS),
+    ("I need a transcript", IntentCategory.ACADEMIC_RECORDS),
+    ("When will grades be posted?", IntentCategory.ACADEMIC_RECORDS),
+    ("I need enrollment verification", IntentCategory.ACADEMIC_RECORDS),
+    ("When will my financial aid come in?", IntentCategory.FINANCIAL),
+    ("How do I pay tuition?", IntentCategory.FINANCIAL),
+    ("The elevator is broken", IntentCategory.FACILITIES),
+    ("Need maintenance in my room", IntentCategory.FACILITIES),
+    ("How do I book a study room?", IntentCategory.FACILITIES),
+    ("How do I register for classes?", IntentCategory.ENROLLMENT),
+    ("I want to drop a class", IntentCategory.ENROLLMENT),
+    ("I have a hold on my account", IntentCategory.ENROLLMENT),
+    ("How do I get a parking permit?", IntentCategory.STUDENT_SERVICES),
+    ("Lost my student ID", IntentCategory.STUDENT_SERVICES),
+    ("I want to appeal my grade", IntentCategory.POLICY_EXCEPTION),
+    ("I need to withdraw", IntentCategory.POLICY_EXCEPTION),
+    ("Request a waiver", IntentCategory.POLICY_EXCEPTION),
+    ("I have a question", IntentCategory.GENERAL_INQUIRY),
+    ("What's the status of my ticket?", IntentCategory.STATUS_CHECK),
+    ("I want to talk to a person", IntentCategory.HUMAN_REQUEST),
+]
+
+CASES_FR004 = [
+    ("My SSN is 123-45-6789", True, "ssn"),
+    ("Call me at 555-123-4567", True, "phone"),
+    ("My email is test@university.edu", True, "email"),
+    ("Credit card: 4111-1111-1111-1111", True, "credit_card"),
+    ("I was born on January 1, 2000", True, "dob"),
+    ("I forgot my password", False, None),
+]
+
+CASES_FR005 = [
+    ("I need help with my password", Sentiment.NEUTRAL),
+    ("This is ridiculous, I've been waiting forever!", Sentiment.FRUSTRATED),
+    ("I'm so frustrated with this system", Sentiment.FRUSTRATED),
+    ("This is urgent, I need help ASAP!", Sentiment.URGENT),
+    ("Thank you so much for your help!", Sentiment.SATISFIED),
+]
+
+CASES_FR006 = [
+    ("I forgot my password", Department.IT),
+    ("Can't log into Canvas", Department.IT),  # Uses example from mock data
+    ("I need a transcript", Department.REGISTRAR),
+    ("When will my financial aid come in?", Department.FINANCIAL_AID),  # Exact match
+    ("The elevator is broken", Department.FACILITIES),
+    ("Lost my student ID", Department.STUDENT_AFFAIRS),
+    # NOTE: Parking permit is categorized as STUDENT_SERVICES which maps to STUDENT_AFFAIRS
+    # in the router. The mock data specifies CAMPUS_SAFETY but router overrides based on category.
+    # This is a known gap - spec says CAMPUS_SAFETY, router maps STUDENT_SERVICES to
+    # STUDENT_AFFAIRS.
+]
+
+CASES_FR008 = [
+    "I want to appeal my grade",
+    "Can I get a waiver?",
+    "I need a refund",
+    "I'm requesting an exception",
+    "Can you override the prerequisite?",
+    # NOTE: "withdrawal" is in policy_keywords list, so it should trigger escalation
+    # The mock checks policy_keywords in the message text, not the intent's escalate flag
+    "Medical withdrawal",  # Contains "withdrawal" keyword
+]
+
+CASES_FR009 = [
+    "I need to report a Title IX incident",
+    "I'm having a mental health crisis",
+    "Someone is threatening me",
+    "I'm feeling suicidal",
+    "There's been sexual harassment",
+]
+
+CASES_FR011 = [
+    "I want to talk to a person",  # Matches mock data "talk to a person"
+    "Transfer me to a human",  # Matches mock data
+    "I want to speak to a real person",  # Matches mock data "real person"
+    "Connect me to an agent",
+    "Human please",  # Exact match in mock data
+]
+
+CASES_FR022 = [
+    "Approve my refund request",
+    "Grant me the waiver",
+    "Accept my appeal",
+    "Approve my exception request",
+]
+
+# Note: These cases verify the system escalates record modification requests.
+# Current mock implementation doesn't explicitly detect all modification intents.
+# In production with real LLM, these should all escalate.
+CASES_FR023 = [
+    "I want to appeal my grade",  # Grade appeal routes to escalation
+    "Request a waiver for my enrollment",  # Waiver triggers escalation
+    "I need an exception to modify my financial aid",  # Exception keyword
+    "Override my transcript hold",  # Override keyword
+]
+
+# Both boundary tables as (message, request label) rows for the per-message check
+CASES_BOUNDARY = (
+    [(message, "Policy") for message in CASES_FR022]
+    + [(message, "Record modification") for message in CASES_FR023]
+)
+
+
+def _params(cases: list) -> list:
+    """Wrap table rows in pytest.param with short, index-prefixed IDs.
+
+    Rows are either a bare message or a tuple whose first item is the message.
+    """
+    params = []
+    for i, row in enumerate(cases):
+        values = row if isinstance(row, tuple) else (row,)
+        params.append(pytest.param(*values, id=f"{i}-{values[0][:30].replace(' ', '_')}"))
+    return params
+
+
+async def _classify_all(llm_service, messages) -> list:
+    """Classify every message concurrently, preserving order."""
+    return await asyncio.gather(*(llm_service.classify_intent(m) for m in messages))
+
+
+# Per-row checks shared by the batched tests and their per-row variants; each
+# returns the failure messages for one row (empty when the row passes).
+def _fr001_mismatches(result, message: str, expected_category: IntentCategory) -> list[str]:
+    if result.intent_category != expected_category:
+        return [
+            f"Message '{message}' should be categorized as {expected_category}, "
+            f"got {result.intent_category}"
+        ]
+    return []
+
+
+def _fr004_mismatches(
+    result, message: str, expected_pii: bool, pii_type: Optional[str]
+) -> list[str]:
+    errors = []
+    if result.pii_detected != expected_pii:
+        errors.append(
+            f"PII detection failed for '{message}': expected {expected_pii}, "
+            f"got {result.pii_detected}"
+        )
+    if pii_type and pii_type not in result.pii_types:
+        errors.append(f"PII type '{pii_type}' not detected in '{message}'")
+    return errors
+
+
+def _fr005_mismatches(result, message: str, expected_sentiment: Sentiment) -> list[str]:
+    if result.sentiment != expected_sentiment:
+        return [
+            f"Sentiment for '{message}' should be {expected_sentiment}, "
+            f"got {result.sentiment}"
+        ]
+    return []
+
+
+def _fr006_mismatches(routing, message: str, expected_dept: Department) -> list[str]:
+    if routing.department != expected_dept:
+        return [
+            f"Message '{message}' should route to {expected_dept}, "
+            f"got {routing.department}"
+        ]
+    return []
+
+
+def _escalation_mismatches(
+    result, message: str, label: str, to_human: bool = False
+) -> list[str]:
+    errors = []
+    if result.requires_escalation is not True:
+        errors.append(f"{label} message '{message}' should require escalation")
+    if to_human and result.department_suggestion != Department.ESCALATE_TO_HUMAN:
+        errors.append(
+            f"{label} message '{message}' should be suggested for "
+            f"{Department.ESCALATE_TO_HUMAN}, got {result.department_suggestion}"
+        )
+    return errors
+
+
+def _human_review_mismatches(result, message: str, label: str) -> list[str]:
+    if result.requires_escalation or result.department_suggestion == Department.ESCALATE_TO_HUMAN:
+        return []
+    return [f"{label} request '{message}' should require human review"]
+
+
+# The router only reads QueryResult fields, so identical queries are
+# validated once and reused.
+@cache
+def _query(
+    confidence: float,
+    sentiment: Sentiment,
+    escalation: bool = False,
+    intent: str = "password_reset",
+    category: IntentCategory = IntentCategory.ACCOUNT_ACCESS,
+    department: Department = Department.IT,
+) -> QueryResult:
+    """Build a classified query with no entities or PII."""
+    return QueryResult(
+        intent=intent,
+        intent_category=category,
+        department_suggestion=department,
+        entities={},
+        confidence=confidence,
+        requires_escalation=escalation,
+        pii_detected=False,
+        sentiment=sentiment,
+    )
+
+
+@pytest.fixture(scope="session")
+def routed_queries(router_agent) -> dict[str, RoutingDecision]:
+    """Route each FR-013/FR-014 query once; both tests read the decisions."""
+    queries = {
+        "policy_escalation": _query(
+            0.92, Sentiment.NEUTRAL, escalation=True, intent="grade_appeal",
+            category=IntentCategory.POLICY_EXCEPTION,
+            department=Department.ESCALATE_TO_HUMAN,
+        ),
+        "threat_escalation": _query(
+            0.9, Sentiment.NEUTRAL, escalation=True, intent="threat",
+            category=IntentCategory.GENERAL_INQUIRY,
+            department=Department.ESCALATE_TO_HUMAN,
+        ),
+        "frustrated": _query(0.85, Sentiment.FRUSTRATED),
+        "standard": _query(0.85, Sentiment.NEUTRAL),
+    }
+    return {name: router_agent.route(query) for name, query in queries.items()}
 
 
 # =============================================================================
@@ -44,57 +320,36 @@ from app.models.schemas import (
 class TestIntentDetectionRequirements:
     """Tests for FR-001 to FR-005: Intent detection and entity extraction."""
 
-    @pytest.fixture
-    def llm_service(self):
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
     # FR-001: System MUST analyze natural language and detect intent from 30+ categories
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_category", [
-        ("I forgot my password", IntentCategory.ACCOUNT_ACCESS),
-        ("Can't log into Canvas", IntentCategory.ACCOUNT_ACCESS),
-        ("My account is locked", IntentCategory.ACCOUNT_ACCESS),
-        ("I need a transcript", IntentCategory.ACADEMIC_RECORDS),
-        ("When will grades be posted?", IntentCategory.ACADEMIC_RECORDS),
-        ("I need enrollment verification", IntentCategory.ACADEMIC_RECORDS),
-        ("When will my financial aid come in?", IntentCategory.FINANCIAL),
-        ("How do I pay tuition?", IntentCategory.FINANCIAL),
-        ("The elevator is broken", IntentCategory.FACILITIES),
-        ("Need maintenance in my room", IntentCategory.FACILITIES),
-        ("How do I book a study room?", IntentCategory.FACILITIES),
-        ("How do I register for classes?", IntentCategory.ENROLLMENT),
-        ("I want to drop a class", IntentCategory.ENROLLMENT),
-        ("I have a hold on my account", IntentCategory.ENROLLMENT),
-        ("How do I get a parking permit?", IntentCategory.STUDENT_SERVICES),
-        ("Lost my student ID", IntentCategory.STUDENT_SERVICES),
-        ("I want to appeal my grade", IntentCategory.POLICY_EXCEPTION),
-        ("I need to withdraw", IntentCategory.POLICY_EXCEPTION),
-        ("Request a waiver", IntentCategory.POLICY_EXCEPTION),
-        ("I have a question", IntentCategory.GENERAL_INQUIRY),
-        ("What's the status of my ticket?", IntentCategory.STATUS_CHECK),
-        ("I want to talk to a person", IntentCategory.HUMAN_REQUEST),
-    ])
+    async def test_fr001_intent_categories_detection_batch(self, llm_service):
+        """FR-001: Verify system detects intents across required categories."""
+        results = await _classify_all(llm_service, (m for m, _ in CASES_FR001))
+        mismatches = [
+            error
+            for (message, expected), result in zip(CASES_FR001, results)
+            for error in _fr001_mismatches(result, message, expected)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message,expected_category", _params(CASES_FR001))
     async def test_fr001_intent_categories_detection(
         self, llm_service, message: str, expected_category: IntentCategory
     ):
-        """FR-001: Verify system detects intents across required categories."""
+        """FR-001: Per-row variant of the intent batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.intent_category == expected_category, (
-            f"Message '{message}' should be categorized as {expected_category}, "
-            f"got {result.intent_category}"
-        )
+        mismatches = _fr001_mismatches(result, message, expected_category)
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-002: System MUST extract entities including building names, course codes, dates
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,entity_key,expected_value", [
+    @pytest.mark.parametrize("message,entity_key,expected_value", _params([
         ("The elevator in Smith Hall is broken", "building", "Smith Hall"),
         ("I need help with CS101", "course_code", "CS101"),
         ("Can't log into Canvas", "system", "Canvas"),
         ("Having trouble with Blackboard", "system", "Blackboard"),
         ("WiFi in Johnson Center isn't working", "building", "Johnson Center"),
         ("I need to drop MATH 201", "course_code", "MATH201"),
-    ])
+    ]))
     async def test_fr002_entity_extraction(
         self, llm_service, message: str, entity_key: str, expected_value: str
     ):
@@ -104,13 +359,13 @@ class TestIntentDetectionRequirements:
             f"Entity '{entity_key}' not extracted from '{message}'"
         )
         # Case-insensitive comparison for flexibility
-        assert result.entities[entity_key].lower() == expected_value.lower(), (
+        extracted = result.entities[entity_key]
+        assert extracted.casefold() == expected_value.casefold(), (
             f"Expected entity '{entity_key}' to be '{expected_value}', "
-            f"got '{result.entities[entity_key]}'"
+            f"got '{extracted}'"
         )
 
     # FR-003: System MUST calculate confidence score 0.0-1.0
-    @pytest.mark.asyncio
     async def test_fr003_confidence_score_range(self, llm_service):
         """FR-003: Verify confidence scores are within valid range."""
         test_messages = [
@@ -126,47 +381,46 @@ class TestIntentDetectionRequirements:
             )
 
     # FR-004: System MUST detect PII and flag for secure handling
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_pii,pii_type", [
-        ("My SSN is 123-45-6789", True, "ssn"),
-        ("Call me at 555-123-4567", True, "phone"),
-        ("My email is test@university.edu", True, "email"),
-        ("Credit card: 4111-1111-1111-1111", True, "credit_card"),
-        ("I was born on January 1, 2000", True, "dob"),
-        ("I forgot my password", False, None),
-    ])
+    async def test_fr004_pii_detection_batch(self, llm_service):
+        """FR-004: Verify PII detection works correctly."""
+        results = await _classify_all(llm_service, (m for m, _, _ in CASES_FR004))
+        mismatches = [
+            error
+            for (message, expected_pii, pii_type), result in zip(CASES_FR004, results)
+            for error in _fr004_mismatches(result, message, expected_pii, pii_type)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message,expected_pii,pii_type", _params(CASES_FR004))
     async def test_fr004_pii_detection(
         self, llm_service, message: str, expected_pii: bool, pii_type: Optional[str]
     ):
-        """FR-004: Verify PII detection works correctly."""
+        """FR-004: Per-row variant of the PII batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.pii_detected == expected_pii, (
-            f"PII detection failed for '{message}': expected {expected_pii}, "
-            f"got {result.pii_detected}"
-        )
-        if pii_type:
-            assert pii_type in result.pii_types, (
-                f"PII type '{pii_type}' not detected in '{message}'"
-            )
+        mismatches = _fr004_mismatches(result, message, expected_pii, pii_type)
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-005: System MUST analyze sentiment
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_sentiment", [
-        ("I need help with my password", Sentiment.NEUTRAL),
-        ("This is ridiculous, I've been waiting forever!", Sentiment.FRUSTRATED),
-        ("I'm so frustrated with this system", Sentiment.FRUSTRATED),
-        ("This is urgent, I need help ASAP!", Sentiment.URGENT),
-        ("Thank you so much for your help!", Sentiment.SATISFIED),
-    ])
+    async def test_fr005_sentiment_detection_batch(self, llm_service):
+        """FR-005: Verify sentiment analysis works correctly."""
+        results = await _classify_all(llm_service, (m for m, _ in CASES_FR005))
+        mismatches = [
+            error
+            for (message, expected), result in zip(CASES_FR005, results)
+            for error in _fr005_mismatches(result, message, expected)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message,expected_sentiment", _params(CASES_FR005))
     async def test_fr005_sentiment_detection(
         self, llm_service, message: str, expected_sentiment: Sentiment
     ):
-        """FR-005: Verify sentiment analysis works correctly."""
+        """FR-005: Per-row variant of the sentiment batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.sentiment == expected_sentiment, (
-            f"Sentiment for '{message}' should be {expected_sentiment}, "
-            f"got {result.sentiment}"
-        )
+        mismatches = _fr005_mismatches(result, message, expected_sentiment)
+        assert not mismatches, "\n".join(mismatches)
 
 
 # =============================================================================
@@ -176,51 +430,28 @@ class TestIntentDetectionRequirements:
 class TestRoutingRequirements:
     """Tests for FR-006 to FR-014: Routing and escalation logic."""
 
-    @pytest.fixture
-    def router_agent(self):
-        from app.agents.router_agent import RouterAgent
-        from app.core.config import Settings
-        settings = Settings(
-            confidence_threshold=0.70,
-            max_clarification_attempts=3,
-            sla_urgent_hours=1,
-            sla_high_hours=4,
-            sla_medium_hours=24,
-            sla_low_hours=72,
-        )
-        return RouterAgent(settings)
-
-    @pytest.fixture
-    def llm_service(self):
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
     # FR-006: Route to correct departments
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message,expected_dept", [
-        ("I forgot my password", Department.IT),
-        ("Can't log into Canvas", Department.IT),  # Uses example from mock data
-        ("I need a transcript", Department.REGISTRAR),
-        ("When will my financial aid come in?", Department.FINANCIAL_AID),  # Exact match
-        ("The elevator is broken", Department.FACILITIES),
-        ("Lost my student ID", Department.STUDENT_AFFAIRS),
-        # NOTE: Parking permit is categorized as STUDENT_SERVICES which maps to STUDENT_AFFAIRS
-        # in the router. The mock data specifies CAMPUS_SAFETY but router overrides based on category.
-        # This is a known gap - spec says CAMPUS_SAFETY, router maps STUDENT_SERVICES to STUDENT_AFFAIRS.
-    ])
+    async def test_fr006_department_routing_batch(self, llm_service, router_agent):
+        """FR-006: Verify routing to correct departments."""
+        results = await _classify_all(llm_service, (m for m, _ in CASES_FR006))
+        mismatches = [
+            error
+            for (message, expected), result in zip(CASES_FR006, results)
+            for error in _fr006_mismatches(router_agent.route(result), message, expected)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message,expected_dept", _params(CASES_FR006))
     async def test_fr006_department_routing(
         self, llm_service, router_agent, message: str, expected_dept: Department
     ):
-        """FR-006: Verify routing to correct departments."""
+        """FR-006: Per-row variant of the routing batch, for diagnostics."""
         query_result = await llm_service.classify_intent(message)
-        routing = router_agent.route(query_result)
-        assert routing.department == expected_dept, (
-            f"Message '{message}' should route to {expected_dept}, "
-            f"got {routing.department}"
-        )
+        mismatches = _fr006_mismatches(router_agent.route(query_result), message, expected_dept)
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-006 Additional: Test that CAMPUS_SAFETY is reachable
-    @pytest.mark.asyncio
     async def test_fr006_campus_safety_routing(self, llm_service, router_agent):
         """FR-006: Verify parking-related requests route correctly.
 
@@ -240,8 +471,7 @@ class TestRoutingRequirements:
         )
 
     # FR-007: Escalate when confidence < 0.70
-    @pytest.mark.asyncio
-    async def test_fr007_low_confidence_escalation(self, router_agent):
+    def test_fr007_low_confidence_escalation(self, router_agent):
         """FR-007: Verify escalation when confidence is below threshold."""
         low_confidence_query = QueryResult(
             intent="unclear",
@@ -259,59 +489,64 @@ class TestRoutingRequirements:
         assert routing.escalation_reason == EscalationReason.MAX_CLARIFICATIONS_EXCEEDED
 
     # FR-008: Escalate for policy keywords
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I want to appeal my grade",
-        "Can I get a waiver?",
-        "I need a refund",
-        "I'm requesting an exception",
-        "Can you override the prerequisite?",
-        # NOTE: "withdrawal" is in policy_keywords list, so it should trigger escalation
-        # The mock checks policy_keywords in the message text, not the intent's escalate flag
-        "Medical withdrawal",  # Contains "withdrawal" keyword
-    ])
-    async def test_fr008_policy_keyword_escalation(self, llm_service, message: str):
+    async def test_fr008_policy_keyword_escalation_batch(self, llm_service):
         """FR-008: Verify escalation for policy keywords."""
+        results = await _classify_all(llm_service, CASES_FR008)
+        mismatches = [
+            error
+            for message, result in zip(CASES_FR008, results)
+            for error in _escalation_mismatches(result, message, "Policy", to_human=True)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message", _params(CASES_FR008))
+    async def test_fr008_policy_keyword_escalation(self, llm_service, message: str):
+        """FR-008: Per-row variant of the policy keyword batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.requires_escalation is True, (
-            f"Policy message '{message}' should require escalation"
-        )
-        assert result.department_suggestion == Department.ESCALATE_TO_HUMAN
+        mismatches = _escalation_mismatches(result, message, "Policy", to_human=True)
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-009: Escalate for sensitive topics
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I need to report a Title IX incident",
-        "I'm having a mental health crisis",
-        "Someone is threatening me",
-        "I'm feeling suicidal",
-        "There's been sexual harassment",
-    ])
-    async def test_fr009_sensitive_topic_escalation(self, llm_service, message: str):
+    async def test_fr009_sensitive_topic_escalation_batch(self, llm_service):
         """FR-009: Verify escalation for sensitive topics."""
+        results = await _classify_all(llm_service, CASES_FR009)
+        mismatches = [
+            error
+            for message, result in zip(CASES_FR009, results)
+            for error in _escalation_mismatches(result, message, "Sensitive")
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message", _params(CASES_FR009))
+    async def test_fr009_sensitive_topic_escalation(self, llm_service, message: str):
+        """FR-009: Per-row variant of the sensitive topic batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.requires_escalation is True, (
-            f"Sensitive message '{message}' should require escalation"
-        )
+        mismatches = _escalation_mismatches(result, message, "Sensitive")
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-011: Escalate when user explicitly requests human
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I want to talk to a person",  # Matches mock data "talk to a person"
-        "Transfer me to a human",  # Matches mock data
-        "I want to speak to a real person",  # Matches mock data "real person"
-        "Connect me to an agent",
-        "Human please",  # Exact match in mock data
-    ])
-    async def test_fr011_explicit_human_request(self, llm_service, message: str):
+    async def test_fr011_explicit_human_request_batch(self, llm_service):
         """FR-011: Verify escalation for explicit human requests."""
+        results = await _classify_all(llm_service, CASES_FR011)
+        mismatches = [
+            error
+            for message, result in zip(CASES_FR011, results)
+            for error in _escalation_mismatches(result, message, "Human request", to_human=True)
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message", _params(CASES_FR011))
+    async def test_fr011_explicit_human_request(self, llm_service, message: str):
+        """FR-011: Per-row variant of the human request batch, for diagnostics."""
         result = await llm_service.classify_intent(message)
-        assert result.requires_escalation is True
-        assert result.department_suggestion == Department.ESCALATE_TO_HUMAN
+        mismatches = _escalation_mismatches(result, message, "Human request", to_human=True)
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-012: Escalate after 3 failed clarification attempts
-    @pytest.mark.asyncio
-    async def test_fr012_max_clarification_escalation(self, router_agent):
+    def test_fr012_max_clarification_escalation(self, router_agent):
         """FR-012: Verify escalation after max clarification attempts."""
         ambiguous_query = QueryResult(
             intent="general_question",
@@ -325,8 +560,9 @@ class TestRoutingRequirements:
         )
 
         # With 2 attempts, should still ask for clarification
-        routing_2 = router_agent.route(ambiguous_query, clarification_attempts=2)
-        needs_clarification = router_agent.needs_clarification(ambiguous_query, clarification_attempts=2)
+        needs_clarification = router_agent.needs_clarification(
+            ambiguous_query, clarification_attempts=2
+        )
         assert needs_clarification is True
 
         # With 3 attempts, should escalate
@@ -335,74 +571,24 @@ class TestRoutingRequirements:
         assert routing_3.escalation_reason == EscalationReason.MAX_CLARIFICATIONS_EXCEEDED
 
     # FR-013: Assign priority levels
-    @pytest.mark.asyncio
-    async def test_fr013_priority_assignment(self, router_agent):
+    def test_fr013_priority_assignment(self, routed_queries):
         """FR-013: Verify correct priority assignment."""
         # URGENT: sensitive topics requiring escalation
-        urgent_query = QueryResult(
-            intent="grade_appeal",
-            intent_category=IntentCategory.POLICY_EXCEPTION,
-            department_suggestion=Department.ESCALATE_TO_HUMAN,
-            entities={},
-            confidence=0.92,
-            requires_escalation=True,
-            pii_detected=False,
-            sentiment=Sentiment.NEUTRAL,
-        )
-        routing = router_agent.route(urgent_query)
-        assert routing.priority == Priority.URGENT
+        assert routed_queries["policy_escalation"].priority == Priority.URGENT
 
         # HIGH: frustrated sentiment
-        frustrated_query = QueryResult(
-            intent="password_reset",
-            intent_category=IntentCategory.ACCOUNT_ACCESS,
-            department_suggestion=Department.IT,
-            entities={},
-            confidence=0.85,
-            requires_escalation=False,
-            pii_detected=False,
-            sentiment=Sentiment.FRUSTRATED,
-        )
-        routing = router_agent.route(frustrated_query)
-        assert routing.priority == Priority.HIGH
+        assert routed_queries["frustrated"].priority == Priority.HIGH
 
         # MEDIUM: standard with good confidence
-        standard_query = QueryResult(
-            intent="password_reset",
-            intent_category=IntentCategory.ACCOUNT_ACCESS,
-            department_suggestion=Department.IT,
-            entities={},
-            confidence=0.85,
-            requires_escalation=False,
-            pii_detected=False,
-            sentiment=Sentiment.NEUTRAL,
-        )
-        routing = router_agent.route(standard_query)
-        assert routing.priority == Priority.MEDIUM
+        assert routed_queries["standard"].priority == Priority.MEDIUM
 
     # FR-014: Set SLA expectations
-    @pytest.mark.asyncio
-    async def test_fr014_sla_assignment(self, router_agent):
+    def test_fr014_sla_assignment(self, routed_queries):
         """FR-014: Verify SLA assignment based on priority."""
         queries = {
-            Priority.URGENT: QueryResult(
-                intent="threat", intent_category=IntentCategory.GENERAL_INQUIRY,
-                department_suggestion=Department.ESCALATE_TO_HUMAN, entities={},
-                confidence=0.9, requires_escalation=True, pii_detected=False,
-                sentiment=Sentiment.NEUTRAL,
-            ),
-            Priority.HIGH: QueryResult(
-                intent="password_reset", intent_category=IntentCategory.ACCOUNT_ACCESS,
-                department_suggestion=Department.IT, entities={},
-                confidence=0.85, requires_escalation=False, pii_detected=False,
-                sentiment=Sentiment.FRUSTRATED,
-            ),
-            Priority.MEDIUM: QueryResult(
-                intent="password_reset", intent_category=IntentCategory.ACCOUNT_ACCESS,
-                department_suggestion=Department.IT, entities={},
-                confidence=0.85, requires_escalation=False, pii_detected=False,
-                sentiment=Sentiment.NEUTRAL,
-            ),
+            Priority.URGENT: "threat_escalation",
+            Priority.HIGH: "frustrated",
+            Priority.MEDIUM: "standard",
         }
 
         expected_slas = {
@@ -411,8 +597,8 @@ class TestRoutingRequirements:
             Priority.MEDIUM: 24,
         }
 
-        for priority, query in queries.items():
-            routing = router_agent.route(query)
+        for priority, name in queries.items():
+            routing = routed_queries[name]
             assert routing.suggested_sla_hours == expected_slas[priority], (
                 f"SLA for {priority} should be {expected_slas[priority]}h, "
                 f"got {routing.suggested_sla_hours}h"
@@ -426,58 +612,69 @@ class TestRoutingRequirements:
 class TestTicketAndKnowledgeRequirements:
     """Tests for FR-015 to FR-017: Ticket creation and KB retrieval."""
 
-    @pytest.fixture
-    def ticket_service(self):
-        from app.services.mock.ticket_service import MockTicketService
-        return MockTicketService()
-
-    @pytest.fixture
-    def kb_service(self):
-        from app.services.mock.knowledge_service import MockKnowledgeService
-        return MockKnowledgeService()
-
     # FR-015: Ticket ID format TKT-{DEPT}-{YYYYMMDD}-{SEQ}
-    def test_fr015_ticket_id_format(self):
-        """FR-015: Verify ticket ID format validation."""
-        valid_ids = [
-            "TKT-IT-20260121-0001",
-            "TKT-HR-20260115-0042",
-            "TKT-FAC-20260101-9999",
-            "TKT-ESC-20260130-0123",
-        ]
-        invalid_ids = [
-            "TKT-IT-2026011-0001",   # Date too short
-            "TKT-IT-20260121-01",    # Seq too short
-            "TICKET-IT-20260121-0001",  # Wrong prefix
-            "TKT-20260121-0001",     # Missing dept
-            "TKT-IT-20260121",       # Missing seq
-        ]
-
-        pattern = r"^TKT-[A-Z]{2,3}-\d{8}-\d{4}$"
-
-        for ticket_id in valid_ids:
-            assert re.match(pattern, ticket_id), f"Valid ID '{ticket_id}' should match pattern"
-
-        for ticket_id in invalid_ids:
-            assert not re.match(pattern, ticket_id), f"Invalid ID '{ticket_id}' should not match pattern"
+    @pytest.mark.parametrize("model", _TICKET_MODELS)
+    @pytest.mark.parametrize("ticket_id", [
+        "TKT-IT-20260121-0001",
+        "TKT-HR-20260115-0042",
+        "TKT-FAC-20260101-9999",
+        "TKT-ESC-20260130-0123",
+    ])
+    def test_fr015_ticket_id_valid(self, model: str, ticket_id: str):
+        """FR-015: Ticket IDs in TKT-{DEPT}-{YYYYMMDD}-{SEQ} format are accepted."""
+        assert _TICKET_ID_RE.fullmatch(ticket_id), f"Valid ID '{ticket_id}' should match pattern"
+        model_cls, fields = _TICKET_MODELS[model]
+        assert model_cls(ticket_id=ticket_id, **fields).ticket_id == ticket_id
+
+    @pytest.mark.parametrize("model", _TICKET_MODELS)
+    @pytest.mark.parametrize("ticket_id", [
+        "TKT-IT-2026011-0001",   # Date too short
+        "TKT-IT-20260121-01",    # Seq too short
+        "TICKET-IT-20260121-0001",  # Wrong prefix
+        "TKT-20260121-0001",     # Missing dept
+        "TKT-IT-20260121",       # Missing seq
+        "TKT-IT-20260121-0001\n",  # Trailing newline
+        "TKT-it-20260121-0001",  # Lowercase dept
+        "TKT-IT-2026012\u0661-0001",  # Non-ASCII digit
+    ])
+    def test_fr015_ticket_id_invalid(self, model: str, ticket_id: str):
+        """FR-015: Ticket IDs outside the spec format are rejected."""
+        assert not _TICKET_ID_RE.fullmatch(ticket_id), (
+            f"Invalid ID '{ticket_id}' should not match pattern"
+        )
+        model_cls, fields = _TICKET_MODELS[model]
+        with pytest.raises(ValidationError, match="ticket_id"):
+            model_cls(ticket_id=ticket_id, **fields)
 
     # FR-016: Retrieve top 3 KB articles
-    @pytest.mark.asyncio
     async def test_fr016_kb_article_limit(self, kb_service):
         """FR-016: Verify KB retrieval returns max 3 articles."""
-        articles = await kb_service.search("password reset help")
-        assert len(articles) <= 3, f"KB should return max 3 articles, got {len(articles)}"
+        # "student" matches more than three articles, so the cap is exercised
+        candidates = await kb_service.search("student", limit=100)
+        assert len(candidates) > 3, "Query should match more than 3 articles"
+
+        articles = await kb_service.search("student")
+        assert len(articles) == 3, f"KB should return max 3 articles, got {len(articles)}"
+        assert [a.article_id for a in articles] == [a.article_id for a in candidates[:3]], (
+            "KB should return the 3 most relevant articles"
+        )
 
     # FR-017: KB articles have required fields
-    @pytest.mark.asyncio
     async def test_fr017_kb_article_structure(self, kb_service):
         """FR-017: Verify KB articles have required fields."""
         articles = await kb_service.search("transcript")
-        for article in articles:
-            assert article.article_id, "Article must have article_id"
-            assert article.title, "Article must have title"
-            assert article.url is not None, "Article must have URL"
-            assert 0.0 <= article.relevance_score <= 1.0, "Relevance score must be 0-1"
+        assert articles, "Expected KB articles for 'transcript'"
+
+        incomplete = [
+            article.article_id for article in articles
+            if not (article.article_id and article.title and article.url is not None)
+        ]
+        assert not incomplete, f"Articles missing article_id, title or URL: {incomplete}"
+
+        scores = [article.relevance_score for article in articles]
+        assert 0.0 <= min(scores) and max(scores) <= 1.0, (
+            f"Relevance scores must be 0-1, got {scores}"
+        )
 
 
 # =============================================================================
@@ -490,16 +687,15 @@ class TestSessionAndAuditRequirements:
     # FR-018: Maintain session context
     def test_fr018_session_context(self):
         """FR-018: Verify session maintains conversation history."""
-        now = datetime.now(timezone.utc)
         session = Session(
-            session_id=uuid4(),
-            student_id_hash="a" * 64,  # 64-char SHA-256 hash
-            created_at=now,
-            last_active=now,
+            session_id=SESSION_ID,
+            student_id_hash=HASH_A,  # 64-char SHA-256 hash
+            created_at=NOW,
+            last_active=NOW,
             conversation_history=[
                 ConversationTurn(
                     turn_number=1,
-                    timestamp=now,
+                    timestamp=NOW,
                     intent="password_reset",
                     ticket_id="TKT-IT-20260121-0001",
                     escalated=False,
@@ -513,21 +709,16 @@ class TestSessionAndAuditRequirements:
         assert session.conversation_history[0].intent == "password_reset"
 
     # FR-019: Session stores hashed student_id
-    def test_fr019_student_id_hashing(self):
+    def test_fr019_student_id_hashing(self, mock_student_id_hash):
         """FR-019: Verify student_id is hashed (64-char SHA-256)."""
-        import hashlib
-
-        student_id = "student123"
-        student_id_hash = hashlib.sha256(student_id.encode()).hexdigest()
+        # conftest hashes the test student ID with SHA-256 once per session
+        assert len(mock_student_id_hash) == 64
 
-        assert len(student_id_hash) == 64
-
-        now = datetime.now(timezone.utc)
         session = Session(
-            session_id=uuid4(),
-            student_id_hash=student_id_hash,
-            created_at=now,
-            last_active=now,
+            session_id=SESSION_ID,
+            student_id_hash=mock_student_id_hash,
+            created_at=NOW,
+            last_active=NOW,
             clarification_attempts=0,
         )
 
@@ -536,13 +727,11 @@ class TestSessionAndAuditRequirements:
     # FR-020: Audit log structure
     def test_fr020_audit_log_structure(self):
         """FR-020: Verify audit log has required fields."""
-        now = datetime.now(timezone.utc)
-
         audit_log = AuditLog(
-            log_id=uuid4(),
-            timestamp=now,
-            student_id_hash="a" * 64,
-            session_id=uuid4(),
+            log_id=LOG_ID,
+            timestamp=NOW,
+            student_id_hash=HASH_A,
+            session_id=SESSION_ID,
             detected_intent="password_reset",
             confidence_score=0.92,
             routed_department=Department.IT,
@@ -560,14 +749,12 @@ class TestSessionAndAuditRequirements:
     # FR-020: Audit log requires escalation_reason if escalated
     def test_fr020_escalation_reason_required(self):
         """FR-020: Verify escalation_reason is required when escalated."""
-        now = datetime.now(timezone.utc)
-
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="escalation_reason"):
             AuditLog(
-                log_id=uuid4(),
-                timestamp=now,
-                student_id_hash="a" * 64,
-                session_id=uuid4(),
+                log_id=LOG_ID,
+                timestamp=NOW,
+                student_id_hash=HASH_A,
+                session_id=SESSION_ID,
                 detected_intent="grade_appeal",
                 confidence_score=0.92,
                 routed_department=Department.ESCALATE_TO_HUMAN,
@@ -586,45 +773,38 @@ class TestSessionAndAuditRequirements:
 class TestSystemBoundaries:
     """Tests for FR-022 to FR-026: Agent authority boundaries."""
 
-    @pytest.fixture
-    def llm_service(self):
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
     # FR-022: MUST NOT approve refunds/waivers/exceptions
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "Approve my refund request",
-        "Grant me the waiver",
-        "Accept my appeal",
-        "Approve my exception request",
-    ])
-    async def test_fr022_no_auto_approval(self, llm_service, message: str):
+    async def test_fr022_no_auto_approval_batch(self, llm_service):
         """FR-022: Verify system never auto-approves policy decisions."""
-        result = await llm_service.classify_intent(message)
+        results = await _classify_all(llm_service, CASES_FR022)
         # All policy-related requests should escalate
-        assert result.requires_escalation or result.department_suggestion == Department.ESCALATE_TO_HUMAN, (
-            f"Policy request '{message}' should require human review"
-        )
+        mismatches = [
+            error
+            for message, result in zip(CASES_FR022, results)
+            for error in _human_review_mismatches(result, message, "Policy")
+        ]
+        assert not mismatches, "\n".join(mismatches)
 
     # FR-023: MUST NOT modify student records
-    # Note: These tests verify the system escalates record modification requests.
-    # Current mock implementation doesn't explicitly detect all modification intents.
-    # In production with real LLM, these should all escalate.
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("message", [
-        "I want to appeal my grade",  # Grade appeal routes to escalation
-        "Request a waiver for my enrollment",  # Waiver triggers escalation
-        "I need an exception to modify my financial aid",  # Exception keyword
-        "Override my transcript hold",  # Override keyword
-    ])
-    async def test_fr023_no_record_modification(self, llm_service, message: str):
+    async def test_fr023_no_record_modification_batch(self, llm_service):
         """FR-023: Verify system cannot modify student records."""
-        result = await llm_service.classify_intent(message)
+        results = await _classify_all(llm_service, CASES_FR023)
         # These should all escalate due to policy keywords
-        assert result.requires_escalation or result.department_suggestion == Department.ESCALATE_TO_HUMAN, (
-            f"Record modification request '{message}' should require human review"
-        )
+        mismatches = [
+            error
+            for message, result in zip(CASES_FR023, results)
+            for error in _human_review_mismatches(result, message, "Record modification")
+        ]
+        assert not mismatches, "\n".join(mismatches)
+
+    # FR-022/FR-023 per-message variant of both batches, for diagnostics
+    @pytest.mark.slow
+    @pytest.mark.parametrize("message,label", _params(CASES_BOUNDARY))
+    async def test_boundary_requires_human_review(self, llm_service, message: str, label: str):
+        """FR-022/FR-023: Each approval or record request requires human review."""
+        result = await llm_service.classify_intent(message)
+        mismatches = _human_review_mismatches(result, message, label)
+        assert not mismatches, "\n".join(mismatches)
 
 
 # =============================================================================
@@ -634,89 +814,77 @@ class TestSystemBoundaries:
 class TestDataModelValidation:
     """Tests for data model constraints from data-model.md."""
 
-    def test_session_clarification_attempts_limit(self):
-        """Session clarification_attempts must be 0-3."""
-        now = datetime.now(timezone.utc)
-
-        # Valid: 0-3
-        for attempts in [0, 1, 2, 3]:
-            session = Session(
-                session_id=uuid4(),
-                student_id_hash="a" * 64,
-                created_at=now,
-                last_active=now,
-                clarification_attempts=attempts,
-            )
-            assert session.clarification_attempts == attempts
+    @pytest.mark.parametrize("attempts", [0, 1, 2, 3])
+    def test_session_clarification_attempts_valid(self, attempts: int):
+        """Session clarification_attempts accepts 0-3."""
+        session = Session(
+            session_id=SESSION_ID,
+            student_id_hash=HASH_A,
+            created_at=NOW,
+            last_active=NOW,
+            clarification_attempts=attempts,
+        )
+        assert session.clarification_attempts == attempts
 
-        # Invalid: > 3
-        with pytest.raises(ValueError):
+    @pytest.mark.parametrize("attempts", [4, 5, -1])
+    def test_session_clarification_attempts_invalid(self, attempts: int):
+        """Session clarification_attempts outside 0-3 is rejected."""
+        with pytest.raises(ValueError, match="clarification_attempts"):
             Session(
-                session_id=uuid4(),
-                student_id_hash="a" * 64,
-                created_at=now,
-                last_active=now,
-                clarification_attempts=4,
+                session_id=SESSION_ID,
+                student_id_hash=HASH_A,
+                created_at=NOW,
+                last_active=NOW,
+                clarification_attempts=attempts,
             )
 
     def test_conversation_history_limit(self):
         """Conversation history limited to 50 turns."""
-        now = datetime.now(timezone.utc)
-
-        # Create 50 turns (max allowed)
-        turns = [
-            ConversationTurn(
-                turn_number=i + 1,
-                timestamp=now,
-                intent="password_reset",
-                escalated=False,
-            )
-            for i in range(50)
-        ]
-
         session = Session(
-            session_id=uuid4(),
-            student_id_hash="a" * 64,
-            created_at=now,
-            last_active=now,
-            conversation_history=turns,
+            session_id=SESSION_ID,
+            student_id_hash=HASH_A,
+            created_at=NOW,
+            last_active=NOW,
+            conversation_history=list(_FULL_HISTORY),
             clarification_attempts=0,
         )
         assert len(session.conversation_history) == 50
 
-    def test_confidence_score_validation(self):
-        """Confidence score must be 0.0-1.0."""
-        # Valid scores
-        for score in [0.0, 0.5, 1.0]:
-            result = QueryResult(
-                intent="password_reset",
-                intent_category=IntentCategory.ACCOUNT_ACCESS,
-                department_suggestion=Department.IT,
-                confidence=score,
+        # One turn past the limit is rejected
+        with pytest.raises(ValueError, match="conversation_history"):
+            Session(
+                session_id=SESSION_ID,
+                student_id_hash=HASH_A,
+                created_at=NOW,
+                last_active=NOW,
+                conversation_history=[*_FULL_HISTORY, _FULL_HISTORY[-1]],
+                clarification_attempts=0,
             )
-            assert result.confidence == score
 
-        # Invalid: > 1.0
-        with pytest.raises(ValueError):
-            QueryResult(
-                intent="password_reset",
-                intent_category=IntentCategory.ACCOUNT_ACCESS,
-                department_suggestion=Department.IT,
-                confidence=1.5,
-            )
+    @pytest.mark.parametrize("score", [0.0, 0.5, 1.0])
+    def test_confidence_score_valid(self, score: float):
+        """Confidence score accepts 0.0-1.0."""
+        result = QueryResult(
+            intent="password_reset",
+            intent_category=IntentCategory.ACCOUNT_ACCESS,
+            department_suggestion=Department.IT,
+            confidence=score,
+        )
+        assert result.confidence == score
 
-        # Invalid: < 0.0
-        with pytest.raises(ValueError):
+    @pytest.mark.parametrize("score", [1.5, -0.1])
+    def test_confidence_score_invalid(self, score: float):
+        """Confidence score outside 0.0-1.0 is rejected."""
+        with pytest.raises(ValueError, match="confidence"):
             QueryResult(
                 intent="password_reset",
                 intent_category=IntentCategory.ACCOUNT_ACCESS,
                 department_suggestion=Department.IT,
-                confidence=-0.1,
+                confidence=score,
             )
 
-    def test_routing_decision_escalation_reason_required(self):
-        """RoutingDecision requires escalation_reason if escalate_to_human is True."""
-        # Valid: escalated with reason
+    def test_routing_decision_escalation_reason_valid(self):
+        """RoutingDecision accepts an escalation with a reason."""
         routing = RoutingDecision(
             department=Department.ESCALATE_TO_HUMAN,
             priority=Priority.HIGH,
@@ -726,8 +894,9 @@ class TestDataModelValidation:
         )
         assert routing.escalation_reason is not None
 
-        # Invalid: escalated without reason
-        with pytest.raises(ValueError):
+    def test_routing_decision_escalation_reason_required(self):
+        """RoutingDecision requires escalation_reason if escalate_to_human is True."""
+        with pytest.raises(ValueError, match="escalation_reason"):
             RoutingDecision(
                 department=Department.ESCALATE_TO_HUMAN,
                 priority=Priority.HIGH,
@@ -757,22 +926,15 @@ class TestDataModelValidation:
         )
         assert len(result.knowledge_articles) == 3
 
-    def test_sla_hours_positive(self):
+    @pytest.mark.parametrize("hours", [0, -1])
+    def test_sla_hours_positive(self, hours: int):
         """suggested_sla_hours must be positive."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="suggested_sla_hours"):
             RoutingDecision(
                 department=Department.IT,
                 priority=Priority.MEDIUM,
                 escalate_to_human=False,
-                suggested_sla_hours=0,
-            )
-
-        with pytest.raises(ValueError):
-            RoutingDecision(
-                department=Department.IT,
-                priority=Priority.MEDIUM,
-                escalate_to_human=False,
-                suggested_sla_hours=-1,
+                suggested_sla_hours=hours,
             )
 
 
@@ -783,20 +945,7 @@ class TestDataModelValidation:
 class TestUserStoryAcceptance:
     """Tests for User Story acceptance scenarios from spec.md."""
 
-    @pytest.fixture
-    def llm_service(self):
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.fixture
-    def router_agent(self):
-        from app.agents.router_agent import RouterAgent
-        from app.core.config import Settings
-        settings = Settings()
-        return RouterAgent(settings)
-
     # US1 - Standard Support Request
-    @pytest.mark.asyncio
     async def test_us1_scenario1_password_reset(self, llm_service, router_agent):
         """US1-S1: Password reset routes to IT."""
         query_result = await llm_service.classify_intent("I forgot my password")
@@ -805,7 +954,6 @@ class TestUserStoryAcceptance:
         assert routing.department == Department.IT
         assert routing.escalate_to_human is False
 
-    @pytest.mark.asyncio
     async def test_us1_scenario2_facilities_entity_extraction(self, llm_service, router_agent):
         """US1-S2: Facilities issue extracts building entity."""
         query_result = await llm_service.classify_intent("The elevator in Smith Hall is broken")
@@ -815,7 +963,6 @@ class TestUserStoryAcceptance:
         assert "building" in query_result.entities
         assert "smith hall" in query_result.entities["building"].lower()
 
-    @pytest.mark.asyncio
     async def test_us1_scenario3_transcript_to_registrar(self, llm_service, router_agent):
         """US1-S3: Transcript request routes to Registrar."""
         query_result = await llm_service.classify_intent("I need a transcript for grad school")
@@ -825,7 +972,6 @@ class TestUserStoryAcceptance:
         assert routing.escalate_to_human is False
 
     # US2 - Policy Escalation
-    @pytest.mark.asyncio
     async def test_us2_scenario1_refund_escalation(self, llm_service, router_agent):
         """US2-S1: Refund request escalates to human."""
         query_result = await llm_service.classify_intent("Can I get a refund for this semester?")
@@ -834,7 +980,6 @@ class TestUserStoryAcceptance:
         assert routing.escalate_to_human is True
         assert routing.department == Department.ESCALATE_TO_HUMAN
 
-    @pytest.mark.asyncio
     async def test_us2_scenario2_grade_appeal(self, llm_service, router_agent):
         """US2-S2: Grade appeal escalates with expected response time."""
         query_result = await llm_service.classify_intent("I want to appeal my grade")
@@ -843,7 +988,6 @@ class TestUserStoryAcceptance:
         assert routing.escalate_to_human is True
         assert routing.suggested_sla_hours > 0  # Has SLA set
 
-    @pytest.mark.asyncio
     async def test_us2_scenario3_sensitive_urgent_escalation(self, llm_service, router_agent):
         """US2-S3: Sensitive topics escalate with urgent priority."""
         query_result = await llm_service.classify_intent("I need to report a Title IX incident")
@@ -853,7 +997,6 @@ class TestUserStoryAcceptance:
         assert routing.priority == Priority.URGENT
 
     # US4 - Clarification
-    @pytest.mark.asyncio
     async def test_us4_scenario1_ambiguous_triggers_clarification(self, llm_service, router_agent):
         """US4-S1: Ambiguous message with low confidence triggers clarification."""
         # The mock service may return varying confidence for truly ambiguous queries
@@ -861,11 +1004,12 @@ class TestUserStoryAcceptance:
 
         # If confidence is below threshold, should need clarification
         if query_result.confidence < 0.70:
-            needs_clarification = router_agent.needs_clarification(query_result, clarification_attempts=0)
+            needs_clarification = router_agent.needs_clarification(
+                query_result, clarification_attempts=0
+            )
             assert needs_clarification is True
 
-    @pytest.mark.asyncio
-    async def test_us4_scenario3_max_clarification_escalates(self, llm_service, router_agent):
+    def test_us4_scenario3_max_clarification_escalates(self, llm_service, router_agent):
         """US4-S3: After 3 failed clarifications, escalate to human."""
         # Create a low-confidence query
         query_result = QueryResult(
@@ -884,7 +1028,6 @@ class TestUserStoryAcceptance:
         assert routing.escalation_reason == EscalationReason.MAX_CLARIFICATIONS_EXCEEDED
 
     # US5 - Human Request
-    @pytest.mark.asyncio
     async def test_us5_scenario1_explicit_human_request(self, llm_service, router_agent):
         """US5-S1: Explicit human request routes to human queue."""
         query_result = await llm_service.classify_intent("I need to talk to a real person")
@@ -902,12 +1045,6 @@ class TestUserStoryAcceptance:
 class TestResponseQuality:
     """Tests for response message quality requirements."""
 
-    @pytest.fixture
-    def llm_service(self):
-        from app.services.mock.llm_service import MockLLMService
-        return MockLLMService()
-
-    @pytest.mark.asyncio
     async def test_response_includes_ticket_id(self, llm_service):
         """Response must include ticket ID when created."""
         ticket_id = "TKT-IT-20260121-0001"
@@ -920,7 +1057,6 @@ class TestResponseQuality:
         )
         assert ticket_id in response
 
-    @pytest.mark.asyncio
     async def test_escalation_response_mentions_human(self, llm_service):
         """Escalation response must mention human review."""
         response = await llm_service.generate_response_message(
@@ -930,10 +1066,8 @@ class TestResponseQuality:
             escalated=True,
             estimated_response_time="1 business day",
         )
-        human_indicators = ["human", "team member", "specialist", "staff", "person"]
-        assert any(indicator in response.lower() for indicator in human_indicators)
+        assert _HUMAN_RE.search(response), f"No human review wording in: {response}"
 
-    @pytest.mark.asyncio
     async def test_response_includes_sla(self, llm_service):
         """Response must include response time expectation."""
         response = await llm_service.generate_response_message(
@@ -943,5 +1077,4 @@ class TestResponseQuality:
             escalated=False,
             estimated_response_time="2-3 business days",
         )
-        time_indicators = ["hour", "day", "business", "within", "expect"]
-        assert any(indicator in response.lower() for indicator in time_indicators)
+        assert _TIME_RE.search(response), f"No response time wording in: {response}"